@@ -6,6 +6,7 @@ credential mounts, CLAUDE.md handling, plugin pre-seeding, timezone detection.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -27,18 +28,28 @@ def _get_runs_dir() -> Path:
 RUNS_DIR = _get_runs_dir()
 
 
-def get_host_timezone() -> str:
-    """Get host IANA timezone (e.g., 'Asia/Kolkata'). Falls back to 'UTC'."""
-    tz_file = Path("/etc/timezone")
-    if tz_file.exists():
-        tz = tz_file.read_text().strip()
+def get_host_timezone(root: Path = Path("/")) -> str:
+    """Get host IANA timezone (e.g., 'Asia/Kolkata'). Falls back to 'UTC'.
+
+    root is for testing -- the filesystem root /etc is read from.
+    """
+    try:
+        with open(root / "etc" / "timezone") as f:
+            tz = f.read().strip()
         if tz:
             return tz
-    localtime = Path("/etc/localtime")
-    if localtime.exists() and localtime.is_symlink():
-        target = str(localtime.resolve())
-        if "zoneinfo/" in target:
-            return target.split("zoneinfo/", 1)[1]
+    except OSError:
+        pass
+    # One readlink usually names the zone; only chase chained links if not
+    localtime = root / "etc" / "localtime"
+    try:
+        target = os.readlink(localtime)
+    except OSError:
+        return "UTC"
+    if "zoneinfo/" not in target:
+        target = os.path.realpath(localtime)
+    if "zoneinfo/" in target:
+        return target.split("zoneinfo/", 1)[1]
     return "UTC"
 
 
@@ -96,7 +107,7 @@ def render_settings_json(config: ScadConfig) -> dict:
                 },
             ],
         },
-        "enabledPlugins": {p: True for p in config.claude.plugins},
+        "enabledPlugins": dict.fromkeys(config.claude.plugins, True),
     }
 
     if config.claude.dangerously_skip_permissions:
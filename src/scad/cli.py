@@ -5,7 +5,6 @@ import os
 import subprocess
 import subprocess as _subprocess
 import sys
-import tempfile
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -13,12 +12,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import click
-import docker
 import yaml
 
 from scad.config import load_config, list_configs, CONFIG_DIR, SCAD_DIR, ScadConfig
 from scad.prompts import parse_prompt_file
 from scad.container import (
+    _docker_client,
     build_image,
     check_claude_auth,
     clean_run,
@@ -80,10 +79,11 @@ def _complete_run_ids(ctx, param, incomplete):
     runs_dir = SCAD_DIR / "runs"
     if not runs_dir.exists():
         return []
-    return sorted(
-        d.name for d in runs_dir.iterdir()
-        if d.is_dir() and d.name.startswith(incomplete)
-    )
+    with os.scandir(runs_dir) as it:
+        return sorted(
+            e.name for e in it
+            if e.name.startswith(incomplete) and e.is_dir()
+        )
 
 
 def _complete_config_names(ctx, param, incomplete):
@@ -300,10 +300,9 @@ def run_agent(
     if rebuild or not image_exists(config):
         tag = f"scad-{config.name}"
         click.echo(f"[scad] Building image {tag}...")
-        with tempfile.TemporaryDirectory() as build_dir:
-            for line in build_image(config, Path(build_dir)):
-                if line.startswith("Step "):
-                    click.echo(f"[scad] {line}")
+        for line in build_image(config, rebuild=rebuild):
+            if line.startswith("Step "):
+                click.echo(f"[scad] {line}")
         click.echo(f"[scad] Image built: {tag}")
     else:
         click.echo(f"[scad] Using cached image scad-{config.name}")
@@ -356,6 +355,8 @@ def run_agent(
 @click.option("--rebuild", is_flag=True, help="Force rebuild the Docker image.")
 def session_start(config_name: str, tag: str, branch: str, prompt: str, headless: bool, rebuild: bool):
     """Launch an agent in a new container."""
+    import docker
+
     if headless and not prompt:
         raise click.ClickException("--headless requires --prompt.")
 
@@ -560,6 +561,8 @@ def config_info(config_name: str):
 @click.option("-v", "--verbose", is_flag=True, help="Show full Docker build output.")
 def build(config_name: str, verbose: bool):
     """Build or rebuild the Docker image for a config."""
+    import docker
+
     try:
         config = load_config(config_name)
     except FileNotFoundError as e:
@@ -572,16 +575,15 @@ def build(config_name: str, verbose: bool):
     tag = f"scad-{config.name}"
     click.echo(f"[scad] Building image {tag}...")
     try:
-        with tempfile.TemporaryDirectory() as build_dir:
-            for line in build_image(config, Path(build_dir)):
-                if verbose:
-                    click.echo(f"  {line}")
-                elif line.startswith("Step "):
-                    click.echo(f"[scad] {line}")
+        for line in build_image(config, rebuild=True):
+            if verbose:
+                click.echo(f"  {line}")
+            elif line.startswith("Step "):
+                click.echo(f"[scad] {line}")
         click.echo(f"[scad] Built: {tag}")
         # After successful build, prune old images
         try:
-            client = docker.from_env()
+            client = _docker_client()
             new_image = client.images.get(tag)
             prune_old_images(client, config.name, new_image.id)
         except Exception:
@@ -754,20 +756,24 @@ def session_stop(run_id, stop_all, config_name, yes):
                 click.echo(f"  {t['run_id']}")
             if not click.confirm("Proceed?"):
                 return
-        for t in targets:
-            stop_container(t["run_id"])
-            log_event(t["run_id"], "stop")
-            click.echo(f"[scad] Stopped: {t['run_id']}")
+        run_ids = [t["run_id"] for t in targets]
+        # Each stop waits on the daemon for up to its timeout — issue them together
+        with ThreadPoolExecutor(max_workers=min(8, len(run_ids))) as executor:
+            for rid, _ in zip(run_ids, executor.map(stop_container, run_ids)):
+                log_event(rid, "stop")
+                click.echo(f"[scad] Stopped: {rid}")
 
 
 @session.command("attach")
 @click.argument("run_id", shell_complete=_complete_run_ids)
 def session_attach(run_id: str):
     """Attach to an interactive tmux session."""
+    import docker
+
     validate_run_id(run_id)
     container_name = f"scad-{run_id}"
     try:
-        client = docker.from_env()
+        client = _docker_client()
         container = client.containers.get(container_name)
     except docker.errors.NotFound:
         click.echo(f"[scad] No container found for {run_id}", err=True)
@@ -980,9 +986,10 @@ def session_clean(run_id, clean_all, config_name, yes, force):
                 click.echo(f"  {s['run_id']} ({s['container']})")
             if not click.confirm("Proceed?"):
                 return
-        for s in sessions:
-            clean_run(s["run_id"])
-            click.echo(f"[scad] Cleaned: {s['run_id']}")
+        run_ids = [s["run_id"] for s in sessions]
+        with ThreadPoolExecutor(max_workers=min(8, len(run_ids))) as executor:
+            for rid, _ in zip(run_ids, executor.map(clean_run, run_ids)):
+                click.echo(f"[scad] Cleaned: {rid}")
 
 
 def _config_for_run(run_id: str) -> "ScadConfig":
@@ -1193,10 +1200,9 @@ def batch(config_name, tag, prompt_file, parallel, fail_fast, no_build):
     if not no_build and not image_exists(config):
         image_tag = f"scad-{config.name}"
         click.echo(f"[scad] Building image {image_tag}...")
-        with tempfile.TemporaryDirectory() as build_dir:
-            for line in build_image(config, Path(build_dir)):
-                if line.startswith("Step "):
-                    click.echo(f"[scad] {line}")
+        for line in build_image(config):
+            if line.startswith("Step "):
+                click.echo(f"[scad] {line}")
         click.echo(f"[scad] Image built: {image_tag}")
 
     # --- Start session ---
@@ -1279,6 +1285,8 @@ def batch(config_name, tag, prompt_file, parallel, fail_fast, no_build):
 @click.option("--tail", is_flag=True, help="Stream Claude activity during wait.")
 def dispatch(config_name, tag, prompt, plan_path, no_wait, headless, attach, fetch, no_build, tail):
     """Start a session and dispatch work. Composites: build -> start -> inject."""
+    import docker
+
     # --- Plan/prompt resolution ---
     if plan_path and prompt:
         raise click.ClickException("--plan and --prompt are mutually exclusive.")
@@ -1335,10 +1343,9 @@ def dispatch(config_name, tag, prompt, plan_path, no_wait, headless, attach, fet
     if not no_build and not image_exists(config):
         image_tag = f"scad-{config.name}"
         click.echo(f"[scad] Building image {image_tag}...")
-        with tempfile.TemporaryDirectory() as build_dir:
-            for line in build_image(config, Path(build_dir)):
-                if line.startswith("Step "):
-                    click.echo(f"[scad] {line}")
+        for line in build_image(config):
+            if line.startswith("Step "):
+                click.echo(f"[scad] {line}")
         click.echo(f"[scad] Image built: {image_tag}")
 
     # --- Start session (container + clones) ---
@@ -1,5 +1,6 @@
 """Config loading and validation."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -37,6 +38,7 @@ repos:
     workdir: true
     # add_dir: false    # add to Claude context with --add-dir
     # worktree: true    # create local clone (false = direct mount)
+    # shared: false     # clone with --shared (borrows host objects, no copy)
     # focus: docs/      # subdir for context prompt
 
 # mounts:              # additional host paths to mount
@@ -62,10 +64,12 @@ class RepoConfig(BaseModel):
     workdir: bool = False
     add_dir: bool = False
     worktree: bool = True
+    shared: bool = False
     focus: Optional[str] = None
 
-    @property
+    @functools.cached_property
     def resolved_path(self) -> Path:
+        # Resolved once per loaded config — realpath stats every component
         return Path(self.path).expanduser().resolve()
 
 
@@ -1,23 +1,59 @@
 """Docker container management."""
 
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import os
 import shutil
 import subprocess
+import tarfile
+import tempfile
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import wait as futures_wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-import docker
-from docker.errors import DockerException, NotFound as DockerNotFound
-from jinja2 import Environment, PackageLoader
 
-from scad.config import ScadConfig, get_scad_home
+from scad.config import RepoConfig, ScadConfig, get_scad_home
+
+# docker (requests, urllib3, ...) and jinja2 dominate CLI start-up, so they
+# are imported inside the functions that use them; commands that never talk
+# to the daemon or render templates don't load them
+if TYPE_CHECKING:
+    import docker
+    import jinja2
+
 
+HOME = Path.home()
 SCAD_DIR = get_scad_home()
 RUNS_DIR = SCAD_DIR / "runs"
+LOGS_DIR = SCAD_DIR / "logs"
+GITCONFIG_PATH = HOME / ".gitconfig"
+CLAUDE_CREDS_PATH = HOME / ".claude" / ".credentials.json"
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+CCUSAGE_TIMEOUT = 10  # seconds per ccusage call (npx cold start included)
+USAGE_BUDGET = 60  # seconds for all usage lookups in a project status
+TRASH_GRACE = 3600  # seconds before gc treats a trash/ entry as abandoned
+
+
+def _has_any_child(path: Path) -> bool:
+    """True if the directory exists and has at least one entry (reads just one)."""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
 
 
 def _migrate_worktrees() -> None:
@@ -31,24 +67,23 @@ def _migrate_worktrees() -> None:
     # Phase 1: Move old top-level worktrees dir into run dirs
     old_dir = SCAD_DIR / "worktrees"
     if old_dir.exists():
-        for entry in list(old_dir.iterdir()):
-            if not entry.is_dir():
-                continue
-            run_id = entry.name
+        with os.scandir(old_dir) as it:
+            run_ids = [e.name for e in it if e.is_dir()]
+        for run_id in run_ids:
             target = RUNS_DIR / run_id / "workspace"
             target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(entry), str(target))
+            shutil.move(str(old_dir / run_id), str(target))
             click.echo(f"[scad] Migrated worktrees for {run_id}")
 
         # Remove old dir if empty
-        if old_dir.exists() and not list(old_dir.iterdir()):
+        if not _has_any_child(old_dir):
             old_dir.rmdir()
 
     # Phase 2: Rename worktrees/ to workspace/ inside existing run dirs
     if RUNS_DIR.exists():
-        for run_dir in RUNS_DIR.iterdir():
-            if not run_dir.is_dir():
-                continue
+        with os.scandir(RUNS_DIR) as it:
+            run_dirs = [Path(e.path) for e in it if e.is_dir()]
+        for run_dir in run_dirs:
             old_worktrees = run_dir / "worktrees"
             new_workspace = run_dir / "workspace"
             if old_worktrees.exists() and not new_workspace.exists():
@@ -56,13 +91,28 @@ def _migrate_worktrees() -> None:
                 click.echo(f"[scad] Migrated {run_dir.name}/worktrees → workspace")
 
 
+@functools.lru_cache(maxsize=1)
+def _docker_client() -> docker.DockerClient:
+    """Return a process-wide Docker client, created on first use.
+
+    Reuses one HTTP session to the daemon instead of reconnecting per call.
+    Construction failures are not cached, so callers can keep catching
+    DockerException as before.
+    """
+    import docker
+
+    return docker.from_env()
+
+
 def _container_exists(run_id: str) -> bool:
     """Check if a scad container exists for this run-id."""
+    import docker
+
     try:
-        client = docker.from_env()
+        client = _docker_client()
         client.containers.get(f"scad-{run_id}")
         return True
-    except (DockerNotFound, DockerException):
+    except docker.errors.DockerException:
         return False
 
 
@@ -73,28 +123,72 @@ def validate_run_id(run_id: str) -> None:
         raise click.ClickException(f"No session found: {run_id}")
 
 
+def _append_events(run_id: str, events: list[tuple[str, str, str]]) -> None:
+    """Append (timestamp, verb, details) events to events.log in one write."""
+    run_dir = RUNS_DIR / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    lines = []
+    for timestamp, verb, details in events:
+        line = f"{timestamp} {verb}"
+        if details:
+            line += f" {details}"
+        lines.append(line + "\n")
+    events_log = run_dir / "events.log"
+    new_log = not events_log.exists()
+    with open(events_log, "a") as f:
+        f.write("".join(lines))
+
+    # Session summary never changes after the first start — cache it for
+    # listings. Only a fresh log is known to hold that first start; older
+    # runs keep being read from events.log.
+    if not new_log:
+        return
+    for timestamp, verb, details in events:
+        if verb == "start":
+            fields = dict(p.split("=", 1) for p in details.split() if "=" in p)
+            (run_dir / "session.json").write_text(json.dumps({
+                "config": fields.get("config", "?"),
+                "branch": fields.get("branch", "?"),
+                "started": timestamp,
+            }))
+            break
+
+
 def log_event(run_id: str, verb: str, details: str = "") -> None:
     """Append an event to ~/.scad/runs/<run-id>/events.log.
 
     Format: <ISO-timestamp> <verb> <details>
     """
-    run_dir = RUNS_DIR / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
-    log_file = run_dir / "events.log"
-    timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M")
-    line = f"{timestamp} {verb}"
-    if details:
-        line += f" {details}"
-    with open(log_file, "a") as f:
-        f.write(line + "\n")
+    timestamp = f"{datetime.now():%Y-%m-%dT%H:%M}"
+    _append_events(run_id, [(timestamp, verb, details)])
+
+
+@contextlib.contextmanager
+def log_events(run_id: str):
+    """Buffer events and append them to events.log in one write on exit.
+
+    Yields an ``emit(verb, details="")`` function. Events emitted before an
+    exception are still written.
+    """
+    events: list[tuple[str, str, str]] = []
+    timestamp = f"{datetime.now():%Y-%m-%dT%H:%M}"
+
+    def emit(verb: str, details: str = "") -> None:
+        events.append((timestamp, verb, details))
+
+    try:
+        yield emit
+    finally:
+        if events:
+            _append_events(run_id, events)
 
 
 def _next_job_id(run_id: str) -> str:
     """Generate sequential job IDs like {run_id}-job-001, {run_id}-job-002, etc."""
     jobs_dir = RUNS_DIR / run_id / "jobs"
     jobs_dir.mkdir(parents=True, exist_ok=True)
-    existing = sorted(jobs_dir.glob("*.json"))
-    next_num = len(existing) + 1
+    with os.scandir(jobs_dir) as it:
+        next_num = sum(1 for e in it if e.name.endswith(".json")) + 1
     return f"{run_id}-job-{next_num:03d}"
 
 
@@ -119,7 +213,7 @@ def inject_job(
     if wait and not headless:
         raise ValueError("wait=True requires headless=True")
     container_name = f"scad-{run_id}"
-    client = docker.from_env()
+    client = _docker_client()
     container = client.containers.get(container_name)
 
     if container.status != "running":
@@ -258,7 +352,7 @@ def send_to_job(
     or multiple interactive jobs without explicit job_id.
     """
     container_name = f"scad-{run_id}"
-    client = docker.from_env()
+    client = _docker_client()
     container = client.containers.get(container_name)
 
     if container.status != "running":
@@ -298,16 +392,44 @@ def send_to_job(
     log_event(run_id, "send", f"job={job_id} text={text[:80]}")
 
 
-def _get_jinja_env() -> Environment:
-    return Environment(loader=PackageLoader("scad", "templates"))
+@functools.lru_cache(maxsize=1)
+def _get_jinja_env() -> jinja2.Environment:
+    import jinja2
+
+    # Templates ship with the package and don't change at runtime. Compiled
+    # templates are cached on disk (per-user temp dir, keyed on source
+    # checksum) so a fresh CLI process skips the parse/compile step.
+    return jinja2.Environment(
+        loader=jinja2.PackageLoader("scad", "templates"),
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _tpl(name: str):
+    return _get_jinja_env().get_template(name)
+
+
+# Fixed English abbreviations — %b follows LC_TIME and would vary by locale
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _stamp(now: datetime) -> str:
+    """MonDD-HHMM suffix shared by run ids and branch names."""
+    return f"{_MONTHS[now.month - 1]}{now.day:02d}-{now.hour:02d}{now.minute:02d}"
 
 
 def generate_run_id(config_name: str, tag: str) -> str:
     """Generate a unique run ID: {config}-{tag}-{MonDD}-{HHMM}."""
-    now = datetime.now()
-    date_str = now.strftime("%b%d")
-    time_str = now.strftime("%H%M")
-    return f"{config_name}-{tag}-{date_str}-{time_str}"
+    return f"{config_name}-{tag}-{_stamp(datetime.now())}"
+
+
+@functools.lru_cache(maxsize=1)
+def _read_credentials(path: str, mtime_ns: int, size: int) -> dict:
+    """Parsed credentials file; re-read only when its mtime or size changes."""
+    return json.loads(Path(path).read_bytes())
 
 
 def check_claude_auth() -> tuple[bool, float]:
@@ -316,11 +438,13 @@ def check_claude_auth() -> tuple[bool, float]:
     Returns (valid, hours_remaining). valid is False if credentials
     are missing or expired. hours_remaining is 0 if invalid.
     """
-    creds_path = Path.home() / ".claude" / ".credentials.json"
-    if not creds_path.exists():
+    creds_path = CLAUDE_CREDS_PATH
+    try:
+        st = creds_path.stat()
+    except FileNotFoundError:
         return False, 0.0
     try:
-        data = json.loads(creds_path.read_text())
+        data = _read_credentials(str(creds_path), st.st_mtime_ns, st.st_size)
         expires_at = data["claudeAiOauth"]["expiresAt"] / 1000  # ms → sec
         remaining = (expires_at - time.time()) / 3600  # seconds → hours
         return remaining > 0, max(remaining, 0.0)
@@ -330,17 +454,89 @@ def check_claude_auth() -> tuple[bool, float]:
 
 def generate_branch_name(config_name: str, tag: str) -> str:
     """Auto-generate branch name: scad-{config}-{tag}-{MonDD}-{HHMM}."""
-    now = datetime.now()
-    return f"scad-{config_name}-{tag}-{now.strftime('%b%d')}-{now.strftime('%H%M')}"
+    return f"scad-{config_name}-{tag}-{_stamp(datetime.now())}"
+
 
+# (packed-refs path, mtime_ns) -> branch names listed in that file
+_packed_refs_cache: dict[tuple[str, int], frozenset[str]] = {}
+
+
+def _resolve_git_dir(repo_path: Path) -> Optional[Path]:
+    """Return the directory holding refs for a repo, or None if unrecognized.
+
+    Follows `.git` files (``gitdir: ...``) and worktree ``commondir`` pointers.
+    Returns None for reftable repos, which have no loose refs to read.
+    """
+    git_dir = repo_path / ".git"
+    if git_dir.is_file():
+        content = git_dir.read_text().strip()
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = Path(content.split(":", 1)[1].strip())
+        if not git_dir.is_absolute():
+            git_dir = repo_path / git_dir
+    if not git_dir.is_dir():
+        return None
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        git_dir = git_dir / commondir.read_text().strip()
+    if (git_dir / "reftable").exists() or not (git_dir / "refs").is_dir():
+        return None
+    return git_dir
+
+
+def _packed_branches(git_dir: Path) -> frozenset[str]:
+    """Return branch names from packed-refs, cached by file mtime."""
+    packed = git_dir / "packed-refs"
+    try:
+        mtime_ns = packed.stat().st_mtime_ns
+    except FileNotFoundError:
+        return frozenset()
+    key = (str(packed), mtime_ns)
+    if key not in _packed_refs_cache:
+        branches = set()
+        with open(packed) as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1].startswith("refs/heads/"):
+                    branches.add(parts[1][len("refs/heads/"):])
+        _packed_refs_cache[key] = frozenset(branches)
+    return _packed_refs_cache[key]
+
+
+def _all_branches(repo_path: Path) -> frozenset[str]:
+    """Return every local branch name in a repo.
+
+    Reads loose refs and packed-refs directly; unrecognized layouts cost
+    one `git for-each-ref` regardless of how many names are checked.
+    """
+    git_dir = _resolve_git_dir(repo_path)
+    if git_dir is not None:
+        heads = git_dir / "refs" / "heads"
+        loose = set()
+        stack = [(str(heads), "")]
+        while stack:
+            path, prefix = stack.pop()
+            try:
+                it = os.scandir(path)
+            except FileNotFoundError:
+                # git doesn't need refs/heads to exist (e.g. everything packed)
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.is_file():
+                        loose.add(prefix + entry.name)
+        return frozenset(loose) | _packed_branches(git_dir)
 
-def check_branch_exists(repo_path: Path, branch: str) -> bool:
-    """Check if a branch exists in a git repo."""
     result = subprocess.run(
-        ["git", "-C", str(repo_path), "branch", "--list", branch],
+        ["git", "-C", str(repo_path), "for-each-ref", "--format=%(refname)", "refs/heads/"],
         capture_output=True, text=True,
     )
-    return bool(result.stdout.strip())
+    return frozenset(
+        line.removeprefix("refs/heads/") for line in result.stdout.splitlines() if line
+    )
 
 
 def resolve_branch(config: ScadConfig, branch: Optional[str], tag: str = "notag") -> str:
@@ -349,26 +545,87 @@ def resolve_branch(config: ScadConfig, branch: Optional[str], tag: str = "notag"
     User-specified branch that already exists raises ClickException.
     Auto-generated branches get -2, -3 suffix on collision.
     """
+    repos_to_check = [(key, repo) for key, repo in config.repos.items() if repo.worktree]
+
+    # List each repo's branches once; every candidate is then an in-process lookup
+    existing: list[frozenset[str]] = []
+    if repos_to_check:
+        with ThreadPoolExecutor(max_workers=len(repos_to_check)) as executor:
+            existing = list(executor.map(
+                lambda item: _all_branches(item[1].resolved_path), repos_to_check
+            ))
+
     if branch is None:
         branch = generate_branch_name(config.name, tag)
         base = branch
         suffix = 2
-        while any(
-            check_branch_exists(repo.resolved_path, branch)
-            for repo in config.repos.values()
-            if repo.worktree
-        ):
+        while any(branch in names for names in existing):
             branch = f"{base}-{suffix}"
             suffix += 1
         return branch
-    else:
-        for key, repo in config.repos.items():
-            if repo.worktree and check_branch_exists(repo.resolved_path, branch):
-                raise click.ClickException(
-                    f"Branch '{branch}' already exists in repo '{key}'. "
-                    "Use a different name or delete the existing branch."
-                )
-        return branch
+
+    for (key, _repo), names in zip(repos_to_check, existing):
+        if branch in names:
+            raise click.ClickException(
+                f"Branch '{branch}' already exists in repo '{key}'. "
+                "Use a different name or delete the existing branch."
+            )
+    return branch
+
+
+def _same_device(a: Path, b: Path) -> bool:
+    """True if both paths live on one filesystem (or either can't be stat'd)."""
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return True
+
+
+def _clone_repo(
+    key: str, repo: RepoConfig, clone_path: Path, branch: str
+) -> tuple[str, Path]:
+    """Clone one repo into the workspace and create the session branch.
+
+    The clone is made with --no-checkout so the working tree is written
+    once, by the branch checkout, rather than twice. With ``shared: true``
+    the clone borrows the source repo's object store via alternates
+    instead of hardlinking every object. --local can't hardlink across
+    filesystems, so a source on another device is cloned shared as well.
+    """
+    shared = repo.shared
+    if not shared and not _same_device(repo.resolved_path, clone_path.parent):
+        click.echo(f"[scad] {key}: source is on another filesystem, using a shared clone")
+        shared = True
+    subprocess.run(
+        ["git", "clone", "--shared" if shared else "--local", "--no-checkout",
+         str(repo.resolved_path), str(clone_path)],
+        check=True,
+    )
+    subprocess.run(
+        ["git", "-C", str(clone_path),
+         "checkout", "-b", branch, "HEAD"],
+        check=True,
+    )
+    return key, clone_path
+
+
+def _alternate_object_dirs(workspace_dir: Path) -> list[Path]:
+    """Object directories borrowed by shared clones in a workspace."""
+    dirs = []
+    if not workspace_dir.is_dir():
+        return dirs
+    with os.scandir(workspace_dir) as it:
+        for entry in it:
+            if entry.is_symlink() or not entry.is_dir():
+                continue
+            alternates = Path(entry.path) / ".git" / "objects" / "info" / "alternates"
+            if not alternates.is_file():
+                continue
+            for line in alternates.read_text().splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    dirs.append(Path(line))
+    return dirs
 
 
 def create_clones(
@@ -390,26 +647,27 @@ def create_clones(
     workspace.mkdir(parents=True, exist_ok=True)
 
     paths = {}
+    worktree_repos = []
     for key, repo in config.repos.items():
         if repo.worktree:
-            clone_path = workspace / key
-            subprocess.run(
-                ["git", "clone", "--local",
-                 str(repo.resolved_path), str(clone_path)],
-                check=True,
-            )
-            subprocess.run(
-                ["git", "-C", str(clone_path),
-                 "checkout", "-b", branch],
-                check=True,
-            )
-            paths[key] = clone_path
+            worktree_repos.append((key, repo))
         else:
             # Symlink non-worktree repos into workspace
             link_path = workspace / key
             link_path.symlink_to(repo.resolved_path)
             paths[key] = link_path
 
+    # Clones are independent and fork-bound — run them concurrently
+    if worktree_repos:
+        with ThreadPoolExecutor(max_workers=min(8, len(worktree_repos))) as executor:
+            futures = [
+                executor.submit(_clone_repo, key, repo, workspace / key, branch)
+                for key, repo in worktree_repos
+            ]
+            for future in as_completed(futures):
+                key, clone_path = future.result()
+                paths[key] = clone_path
+
     # Create persistent run directory for Claude session data
     run_dir = RUNS_DIR / run_id / "claude"
     run_dir.mkdir(parents=True, exist_ok=True)
@@ -422,6 +680,57 @@ def create_clones(
     return paths
 
 
+def _fast_rmtree(root: Path, ignore_errors: bool = False) -> None:
+    """rmtree with each top-level subdirectory removed concurrently.
+
+    Workspace dirs hold one clone per repo; deleting them in parallel
+    overlaps the unlink work instead of walking clone after clone.
+    """
+    with os.scandir(root) as it:
+        subdirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(subdirs))) as executor:
+            list(executor.map(
+                functools.partial(shutil.rmtree, ignore_errors=ignore_errors), subdirs
+            ))
+    shutil.rmtree(root, ignore_errors=ignore_errors)
+
+
+def _trash_dir() -> Path:
+    """Holding area for trees awaiting background deletion (next to runs/)."""
+    return RUNS_DIR.parent / "trash"
+
+
+def _usage_cache_dir() -> Path:
+    """Cached ccusage results, one <run_id>.json each (next to runs/)."""
+    return RUNS_DIR.parent / "cache" / "usage"
+
+
+def _discard_tree(path: Path) -> None:
+    """Move a tree into the trash dir and delete it on a background thread.
+
+    The rename is a single syscall, so the path is gone as soon as this
+    returns and the delete overlaps with the rest of the command. The
+    thread is non-daemon, so the interpreter still waits for it before
+    exiting — total CLI wall time is not reduced, only the time until the
+    path disappears. Anything left over (e.g. after a crash) is swept by
+    gc once it is older than TRASH_GRACE. Falls back to deleting in place
+    if the rename fails.
+    """
+    trash = _trash_dir() / uuid.uuid4().hex
+    try:
+        trash.parent.mkdir(parents=True, exist_ok=True)
+        os.rename(path, trash)
+        # rename keeps the old mtime; stamp the move so gc can age entries
+        os.utime(trash)
+    except OSError:
+        _fast_rmtree(path)
+        return
+    threading.Thread(
+        target=_fast_rmtree, args=(trash,), kwargs={"ignore_errors": True}, daemon=False
+    ).start()
+
+
 def cleanup_clones(run_id: str) -> None:
     """Remove clones for a completed run.
 
@@ -432,99 +741,113 @@ def cleanup_clones(run_id: str) -> None:
     for subdir in ("workspace", "worktrees"):
         clone_base = RUNS_DIR / run_id / subdir
         if clone_base.exists():
-            shutil.rmtree(clone_base)
+            _discard_tree(clone_base)
 
 
 def clean_run(run_id: str) -> None:
     """Remove container, clones, and run directory for a run. Point of no return."""
-    # Stop + remove container if it exists
+    import docker
+
+    # Kill + remove container if it exists — no graceful stop, the run is going away
     try:
-        client = docker.from_env()
+        client = _docker_client()
         container_name = f"scad-{run_id}"
         container = client.containers.get(container_name)
-        container.stop(timeout=10)
-        container.remove()
-    except (DockerNotFound, DockerException):
+        container.remove(force=True)
+    except docker.errors.DockerException:
         pass
 
     # Remove entire run directory (worktrees + claude data + events.log)
     run_dir = RUNS_DIR / run_id
     if run_dir.exists():
-        shutil.rmtree(run_dir)
-
-
-def render_build_context(config: ScadConfig, build_dir: Path) -> None:
-    """Render Dockerfile and entrypoint into a build context directory."""
-    env = _get_jinja_env()
-
-    workdir_key = config.workdir_key
-    workdir_repo = config.repos[workdir_key]
-
-    # Check if requirements.txt exists in the workdir repo
-    requirements_content = False
-    if config.python.requirements:
-        req_path = workdir_repo.resolved_path / config.python.requirements
-        if req_path.exists():
-            shutil.copy2(req_path, build_dir / "requirements.txt")
-            requirements_content = True
-
-    # Determine requirements file path inside container for entrypoint pip sync
-    requirements_file = None
-    if config.python.requirements:
-        requirements_file = config.python.requirements
-
-    # Render Dockerfile
-    dockerfile_template = env.get_template("Dockerfile.j2")
-    dockerfile_content = dockerfile_template.render(
-        base_image=config.base_image,
-        apt_packages=config.apt_packages,
-        requirements_content=requirements_content,
-    )
-    (build_dir / "Dockerfile").write_text(dockerfile_content)
-
-    # Render entrypoint
-    entrypoint_template = env.get_template("entrypoint.sh.j2")
-    entrypoint_content = entrypoint_template.render(
-        config_name=config.name,
-        workdir_key=workdir_key,
-        requirements_file=requirements_file,
-        python_editable=config.python.editable,
-    )
-    (build_dir / "entrypoint.sh").write_text(entrypoint_content)
+        cleanup_clones(run_id)
+        _discard_tree(run_dir)
+    (_usage_cache_dir() / f"{run_id}.json").unlink(missing_ok=True)
 
-    # Render bootstrap config (plugins list from config)
-    bootstrap_conf_template = env.get_template("bootstrap-claude.conf.j2")
-    bootstrap_conf_content = bootstrap_conf_template.render(
-        plugins=config.claude.plugins,
-    )
-    (build_dir / "bootstrap-claude.conf").write_text(bootstrap_conf_content)
 
-    # Copy static bootstrap script
-    bootstrap_script = Path(__file__).parent / "templates" / "bootstrap-claude.sh"
-    shutil.copy2(bootstrap_script, build_dir / "bootstrap-claude.sh")
+# Copied verbatim from templates/ into every build context
+_STATIC_CONTEXT_FILES = ("bootstrap-claude.sh", ".tmux.conf", "statusline.sh")
 
-    # Copy .tmux.conf template
-    tmux_conf_src = Path(__file__).parent / "templates" / ".tmux.conf"
-    shutil.copy2(tmux_conf_src, build_dir / ".tmux.conf")
 
-    # Copy statusline script
-    statusline_src = Path(__file__).parent / "templates" / "statusline.sh"
-    shutil.copy2(statusline_src, build_dir / "statusline.sh")
+def _requirements_path(config: ScadConfig) -> Optional[Path]:
+    """Host path of the workdir repo's requirements file, if configured."""
+    if not config.python.requirements:
+        return None
+    return config.repos[config.workdir_key].resolved_path / config.python.requirements
 
-    # Render seed JSON files for entrypoint config seeding
+
+def _render_context_templates(config: ScadConfig, requirements_content: bool) -> dict[str, str]:
+    """Render the generated build-context files, keyed by file name."""
     from scad.claude_config import render_claude_json, render_settings_json
 
-    seed_claude = render_claude_json(config)
-    (build_dir / "seed-claude.json").write_text(json.dumps(seed_claude, indent=2))
+    return {
+        "Dockerfile": _tpl("Dockerfile.j2").render(
+            base_image=config.base_image,
+            apt_packages=config.apt_packages,
+            requirements_content=requirements_content,
+        ),
+        "entrypoint.sh": _tpl("entrypoint.sh.j2").render(
+            config_name=config.name,
+            workdir_key=config.workdir_key,
+            # Requirements path inside the container for entrypoint pip sync
+            requirements_file=config.python.requirements or None,
+            python_editable=config.python.editable,
+        ),
+        # Plugins list from config
+        "bootstrap-claude.conf": _tpl("bootstrap-claude.conf.j2").render(
+            plugins=config.claude.plugins,
+        ),
+        # Seed JSON files for entrypoint config seeding
+        "seed-claude.json": json.dumps(render_claude_json(config), indent=2),
+        "seed-settings.json": json.dumps(render_settings_json(config), indent=2),
+    }
+
+
+def _build_context_files(config: ScadConfig) -> dict[str, bytes]:
+    """Render the build context in memory, keyed by file name.
 
-    seed_settings = render_settings_json(config)
-    (build_dir / "seed-settings.json").write_text(json.dumps(seed_settings, indent=2))
+    Nothing is written to disk; only the templates and the workdir repo's
+    requirements file are read.
+    """
+    files: dict[str, bytes] = {}
+    req_path = _requirements_path(config)
+    if req_path is not None and req_path.exists():
+        files["requirements.txt"] = req_path.read_bytes()
+    rendered = _render_context_templates(config, "requirements.txt" in files)
+    files.update((name, content.encode()) for name, content in rendered.items())
+    for name in _STATIC_CONTEXT_FILES:
+        files[name] = (TEMPLATES_DIR / name).read_bytes()
+    return files
+
+
+def _build_context_tar(files: dict[str, bytes]) -> io.BytesIO:
+    """Pack build-context files into an in-memory tar archive."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+    buf.seek(0)
+    return buf
+
+
+def _context_digest(files: dict[str, bytes]) -> str:
+    """Content hash of a build context — equal digests build identical images."""
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(files):
+        h.update(name.encode() + b"\0" + str(len(files[name])).encode() + b"\0")
+        h.update(files[name])
+    return h.hexdigest()
 
 
 def list_scad_containers() -> list[dict]:
     """List running scad containers from Docker."""
+    import docker
+
     try:
-        client = docker.from_env()
+        client = _docker_client()
     except docker.errors.DockerException:
         return []
     containers = client.containers.list(filters={"label": "scad.managed=true"})
@@ -546,9 +869,11 @@ def get_recently_crashed(max_age_minutes: int = 30) -> list[dict]:
 
     Checks Docker exited containers with scad labels.
     """
+    import docker
+
     crashed = []
     try:
-        client = docker.from_env()
+        client = _docker_client()
         containers = client.containers.list(
             all=True,
             filters={"label": "scad.managed=true", "status": "exited"},
@@ -567,32 +892,43 @@ def get_recently_crashed(max_age_minutes: int = 30) -> list[dict]:
     return crashed
 
 
+def _read_status(entry: os.DirEntry) -> Optional[dict]:
+    """Parse one <run-id>.status.json into a run summary, or None if malformed."""
+    try:
+        with open(entry.path, "rb") as f:
+            data = json.load(f)
+        return {
+            "run_id": data.get("run_id", entry.name.removesuffix(".status.json")),
+            "config": data.get("config", "?"),
+            "branch": data.get("branch", "?"),
+            "started": data.get("started", ""),
+            "status": f"exited({data.get('exit_code', '?')})",
+        }
+    except (json.JSONDecodeError, KeyError):
+        return None
+
+
 def list_completed_runs(logs_dir: Optional[Path] = None) -> list[dict]:
     """List completed runs from status JSON files."""
     if logs_dir is None:
-        logs_dir = SCAD_DIR / "logs"
+        logs_dir = LOGS_DIR
     if not logs_dir.exists():
         return []
-    results = []
-    for status_file in sorted(logs_dir.glob("*.status.json")):
-        try:
-            data = json.loads(status_file.read_text())
-            results.append({
-                "run_id": data.get("run_id", status_file.stem.replace(".status", "")),
-                "config": data.get("config", "?"),
-                "branch": data.get("branch", "?"),
-                "started": data.get("started", ""),
-                "status": f"exited({data.get('exit_code', '?')})",
-            })
-        except (json.JSONDecodeError, KeyError):
-            continue
-    return results
+    # Unordered — session listings sort by start time, not by file name
+    with os.scandir(logs_dir) as it:
+        entries = [e for e in it if e.name.endswith(".status.json")]
+    if not entries:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+        return [r for r in executor.map(_read_status, entries) if r is not None]
 
 
 def stop_container(run_id: str) -> bool:
     """Stop a scad container by run ID. Does NOT remove — use clean for that."""
+    import docker
+
     try:
-        client = docker.from_env()
+        client = _docker_client()
     except docker.errors.DockerException:
         return False
     container_name = f"scad-{run_id}"
@@ -604,19 +940,36 @@ def stop_container(run_id: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _scad_image_created() -> dict[str, str]:
+    """Map of scad image name -> ISO creation time, from one image listing.
+
+    Uses the /images/json summary rather than inspecting each image.
+    Only :latest tags count; ctx-<hash> tags on older images share the
+    repo name. Cleared by build_image once a new image exists.
+    """
+    created = {}
+    for img in _docker_client().api.images(filters={"reference": "scad-*"}):
+        stamp = datetime.fromtimestamp(img.get("Created", 0), timezone.utc).isoformat()
+        for repo_tag in img.get("RepoTags") or []:
+            repo, _, image_tag = repo_tag.rpartition(":")
+            if image_tag == "latest":
+                created[repo] = stamp
+    return created
+
+
 def get_image_info(config_name: str) -> Optional[dict]:
     """Get Docker image info for a config. Returns None if not built."""
+    import docker
+
     tag = f"scad-{config_name}"
     try:
-        client = docker.from_env()
+        created = _scad_image_created().get(tag)
     except docker.errors.DockerException:
         return None
-    try:
-        image = client.images.get(tag)
-        created = image.attrs.get("Created", "")
-        return {"tag": tag, "created": created}
-    except docker.errors.ImageNotFound:
+    if created is None:
         return None
+    return {"tag": tag, "created": created}
 
 
 def prune_old_images(client, config_name: str, new_image_id: str) -> None:
@@ -636,13 +989,36 @@ def prune_old_images(client, config_name: str, new_image_id: str) -> None:
         pass
 
 
-def build_image(config: ScadConfig, build_dir: Path):
-    """Build a Docker image for the given config. Yields build log lines."""
+def build_image(config: ScadConfig, rebuild: bool = False):
+    """Build a Docker image for the given config. Yields build log lines.
+
+    The build context is generated in memory and streamed to the daemon
+    as a tar archive, so no temporary build directory is needed.
+
+    rebuild=True always runs the build, even when an image for the same
+    context exists — the context hash doesn't cover the FROM base image.
+    """
+    import docker
+
     tag = f"scad-{config.name}"
-    render_build_context(config, build_dir)
+    files = _build_context_files(config)
+    # Every build is also tagged with its context hash, so an identical
+    # context maps straight back to the image it produced (until
+    # prune_old_images removes it after a `scad build`)
+    ctx_tag = f"ctx-{_context_digest(files)[:16]}"
+
+    client = _docker_client()
+    if not rebuild:
+        try:
+            client.images.get(f"{tag}:{ctx_tag}").tag(tag)
+            yield f"Build context unchanged, using existing image {tag}"
+            return
+        except docker.errors.ImageNotFound:
+            pass
 
-    client = docker.from_env()
-    for chunk in client.api.build(path=str(build_dir), tag=tag, rm=True, decode=True):
+    for chunk in client.api.build(
+        fileobj=_build_context_tar(files), custom_context=True, tag=tag, rm=True, decode=True
+    ):
         if "stream" in chunk:
             line = chunk["stream"].rstrip()
             if line:
@@ -650,16 +1026,34 @@ def build_image(config: ScadConfig, build_dir: Path):
         elif "error" in chunk:
             raise docker.errors.BuildError(chunk["error"], [])
 
+    client.api.tag(tag, tag, ctx_tag)
+    _scad_image_created.cache_clear()
+
 
 def image_exists(config: ScadConfig) -> bool:
     """Check if the Docker image for this config already exists."""
-    tag = f"scad-{config.name}"
-    client = docker.from_env()
-    try:
-        client.images.get(tag)
-        return True
-    except docker.errors.ImageNotFound:
-        return False
+    # A filtered listing answers "missing" with [] instead of a 404 + exception
+    return bool(_docker_client().api.images(name=f"scad-{config.name}:latest", quiet=True))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_host(path: str) -> str:
+    """Absolute, symlink-free form of a configured host path."""
+    return str(Path(path).expanduser().resolve())
+
+
+@functools.lru_cache(maxsize=1)
+def _host_paths() -> dict:
+    """Host facts run_container needs, looked up once per process.
+
+    gitconfig is the path to mount (None when absent); timezone is the
+    host IANA zone passed through as TZ.
+    """
+    from scad.claude_config import get_host_timezone
+    return {
+        "gitconfig": GITCONFIG_PATH if GITCONFIG_PATH.is_file() else None,
+        "timezone": get_host_timezone(),
+    }
 
 
 def run_container(
@@ -673,8 +1067,8 @@ def run_container(
     if image_tag is None:
         image_tag = f"scad-{config.name}"
 
-    client = docker.from_env()
-    logs_dir = SCAD_DIR / "logs"
+    client = _docker_client()
+    logs_dir = LOGS_DIR
     logs_dir.mkdir(parents=True, exist_ok=True)
 
     # Build volume mounts
@@ -688,22 +1082,26 @@ def run_container(
     volumes[str(logs_dir)] = {"bind": "/scad-logs", "mode": "rw"}
 
     # Git config — mount as read-only source, entrypoint copies to writable location
-    gitconfig = Path.home() / ".gitconfig"
-    if gitconfig.exists():
+    host = _host_paths()
+    gitconfig = host["gitconfig"]
+    if gitconfig is not None:
         volumes[str(gitconfig)] = {"bind": "/mnt/host-gitconfig", "mode": "ro"}
 
+    # Shared clones read objects from the source repo — mount it at the same path
+    for objects_dir in _alternate_object_dirs(workspace_dir):
+        volumes[str(objects_dir)] = {"bind": str(objects_dir), "mode": "ro"}
+
     # Data mounts — direct bind mounts (not managed by scad)
     for mount in config.mounts:
-        host_path = str(Path(mount.host).expanduser().resolve())
-        volumes[host_path] = {"bind": mount.container, "mode": "rw"}
+        volumes[_resolve_host(mount.host)] = {"bind": mount.container, "mode": "rw"}
 
     # Claude-related mounts (credentials, claude dir, claude.json, CLAUDE.md, localtime)
-    from scad.claude_config import get_volume_mounts, get_host_timezone
+    from scad.claude_config import get_volume_mounts
     volumes.update(get_volume_mounts(config, run_id))
 
     # Environment variables
     # Pass host timezone so git commits, logs, and branch names match host time
-    environment = {"RUN_ID": run_id, "TZ": get_host_timezone()}
+    environment = {"RUN_ID": run_id, "TZ": host["timezone"]}
 
     # Pass through API key if set
     api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -750,55 +1148,66 @@ def _resolve_workspace_dir(run_id: str) -> Path:
     raise FileNotFoundError(f"No clones found for run: {run_id}")
 
 
-def fetch_to_host(run_id: str, config: ScadConfig) -> list[dict]:
-    """Fetch branches from clones back to source repos.
+def _fetch_repo(key: str, repo_cfg: RepoConfig, clone_path: Path) -> list[dict]:
+    """Fetch all non-default branches of one clone back into its source repo."""
+    if not clone_path.exists() or clone_path.is_symlink() or not (clone_path / ".git").exists():
+        return []
 
-    Discovers all non-default branches in each clone and fetches them.
-    """
-    clone_base = _resolve_workspace_dir(run_id)
+    source_path = repo_cfg.resolved_path
 
-    results = []
-    for key, repo_cfg in config.repos.items():
-        clone_path = clone_base / key
-        if not clone_path.exists() or clone_path.is_symlink() or not (clone_path / ".git").exists():
-            continue
+    # Get current branch
+    current = subprocess.run(
+        ["git", "-C", str(clone_path), "rev-parse", "--abbrev-ref", "HEAD"],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
 
-        source_path = repo_cfg.resolved_path
+    # Get all local branches
+    all_branches_out = subprocess.run(
+        ["git", "-C", str(clone_path), "branch", "--list", "--format=%(refname:short)"],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
 
-        # Get current branch
-        current = subprocess.run(
-            ["git", "-C", str(clone_path), "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True, text=True, check=True,
-        ).stdout.strip()
+    all_branches = [b.strip() for b in all_branches_out.split("\n") if b.strip()]
 
-        # Get all local branches
-        all_branches_out = subprocess.run(
-            ["git", "-C", str(clone_path), "branch", "--list", "--format=%(refname:short)"],
-            capture_output=True, text=True, check=True,
-        ).stdout.strip()
+    # Filter to non-default branches
+    default = _detect_default_branch(clone_path)
+    branches_to_fetch = [b for b in all_branches if b != default and b != "HEAD"]
+
+    results = []
+    for branch in branches_to_fetch:
+        try:
+            subprocess.run(
+                ["git", "-C", str(source_path), "fetch",
+                 str(clone_path), f"{branch}:{branch}"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+            )
+            results.append({"repo": key, "branch": branch, "source": str(source_path)})
+        except subprocess.CalledProcessError:
+            pass
+    return results
 
-        all_branches = [b.strip() for b in all_branches_out.split("\n") if b.strip()]
 
-        # Filter to non-default branches
-        default = _detect_default_branch(clone_path)
-        branches_to_fetch = [b for b in all_branches if b != default and b != "HEAD"]
+def fetch_to_host(run_id: str, config: ScadConfig) -> list[dict]:
+    """Fetch branches from clones back to source repos.
 
-        if not branches_to_fetch:
-            continue
+    Discovers all non-default branches in each clone and fetches them.
+    Repos are processed concurrently; results keep config order.
+    """
+    clone_base = _resolve_workspace_dir(run_id)
 
-        for branch in branches_to_fetch:
-            try:
-                subprocess.run(
-                    ["git", "-C", str(source_path), "fetch",
-                     str(clone_path), f"{branch}:{branch}"],
-                    capture_output=True, text=True, check=True,
-                )
-                results.append({"repo": key, "branch": branch, "source": str(source_path)})
-            except subprocess.CalledProcessError:
-                pass
+    results = []
+    if config.repos:
+        with ThreadPoolExecutor(max_workers=min(8, len(config.repos))) as executor:
+            per_repo = executor.map(
+                lambda item: _fetch_repo(item[0], item[1], clone_base / item[0]),
+                config.repos.items(),
+            )
+            for repo_results in per_repo:
+                results.extend(repo_results)
 
-    for r in results:
-        log_event(run_id, "fetch", f"{r['repo']} {r['branch']} → {r['source']}")
+    with log_events(run_id) as emit:
+        for r in results:
+            emit("fetch", f"{r['repo']} {r['branch']} → {r['source']}")
 
     return results
 
@@ -808,13 +1217,67 @@ def _detect_default_branch(clone_path: Path) -> Optional[str]:
     for name in ("main", "master"):
         result = subprocess.run(
             ["git", "-C", str(clone_path), "rev-parse", "--verify", f"refs/heads/{name}"],
-            capture_output=True, text=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
         )
         if result.returncode == 0:
             return name
     return None
 
 
+def _sync_repo(
+    key: str,
+    repo_cfg: RepoConfig,
+    clone_path: Path,
+    update_main: bool,
+    checkout: Optional[str],
+) -> tuple[Optional[dict], Optional[str]]:
+    """Sync one clone from its source repo.
+
+    Returns (result_entry, warning). result_entry is None when the repo has
+    no clone; warning is set when the default branch could not fast-forward.
+    """
+    if not clone_path.exists() or clone_path.is_symlink():
+        return None, None
+
+    source_path = repo_cfg.resolved_path
+    warning = None
+
+    # 1. Fetch all refs
+    subprocess.run(
+        ["git", "-C", str(clone_path), "fetch", str(source_path),
+         "+refs/heads/*:refs/remotes/origin/*"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+    )
+
+    result_entry = {"repo": key, "source": str(source_path), "main_updated": None}
+
+    # 2. Fast-forward main (if requested)
+    if update_main:
+        default_branch = _detect_default_branch(clone_path)
+        if default_branch:
+            try:
+                subprocess.run(
+                    ["git", "-C", str(clone_path), "fetch", str(source_path),
+                     f"{default_branch}:{default_branch}"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+                )
+                result_entry["main_updated"] = True
+            except subprocess.CalledProcessError:
+                warning = (
+                    f"[scad] Warning: {key}/{default_branch} diverged from host \u2014 skipped fast-forward"
+                )
+                result_entry["main_updated"] = False
+
+    # 3. Checkout (if requested)
+    if checkout:
+        subprocess.run(
+            ["git", "-C", str(clone_path), "checkout", checkout],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+        )
+
+    return result_entry, warning
+
+
 def sync_from_host(
     run_id: str,
     config: ScadConfig,
@@ -828,60 +1291,34 @@ def sync_from_host(
         checkout: Branch to checkout after sync (e.g., "main").
 
     Does NOT checkout or merge — just makes refs available.
+    Repos are processed concurrently; results keep config order.
     """
     clone_base = _resolve_workspace_dir(run_id)
 
     results = []
-    for key, repo_cfg in config.repos.items():
-        clone_path = clone_base / key
-        if not clone_path.exists() or clone_path.is_symlink():
-            continue
-
-        source_path = repo_cfg.resolved_path
-
-        # 1. Fetch all refs
-        subprocess.run(
-            ["git", "-C", str(clone_path), "fetch", str(source_path),
-             "+refs/heads/*:refs/remotes/origin/*"],
-            capture_output=True, text=True, check=True,
-        )
-
-        result_entry = {"repo": key, "source": str(source_path), "main_updated": None}
-
-        # 2. Fast-forward main (if requested)
-        if update_main:
-            default_branch = _detect_default_branch(clone_path)
-            if default_branch:
-                try:
-                    subprocess.run(
-                        ["git", "-C", str(clone_path), "fetch", str(source_path),
-                         f"{default_branch}:{default_branch}"],
-                        capture_output=True, text=True, check=True,
-                    )
-                    result_entry["main_updated"] = True
-                except subprocess.CalledProcessError:
-                    click.echo(
-                        f"[scad] Warning: {key}/{default_branch} diverged from host \u2014 skipped fast-forward"
-                    )
-                    result_entry["main_updated"] = False
-
-        # 3. Checkout (if requested)
-        if checkout:
-            subprocess.run(
-                ["git", "-C", str(clone_path), "checkout", checkout],
-                capture_output=True, text=True, check=True,
+    if config.repos:
+        with ThreadPoolExecutor(max_workers=min(8, len(config.repos))) as executor:
+            per_repo = executor.map(
+                lambda item: _sync_repo(
+                    item[0], item[1], clone_base / item[0], update_main, checkout
+                ),
+                config.repos.items(),
             )
-
-        results.append(result_entry)
+            for result_entry, warning in per_repo:
+                if warning:
+                    click.echo(warning)
+                if result_entry is not None:
+                    results.append(result_entry)
 
     # Log to events.log
-    for r in results:
-        details = f"{r['repo']} \u2190 {r['source']}"
-        if r.get("main_updated") is True:
-            details += " (main updated)"
-        elif r.get("main_updated") is False:
-            details += " (main diverged, skipped)"
-        log_event(run_id, "sync", details)
+    with log_events(run_id) as emit:
+        for r in results:
+            details = f"{r['repo']} \u2190 {r['source']}"
+            if r.get("main_updated") is True:
+                details += " (main updated)"
+            elif r.get("main_updated") is False:
+                details += " (main diverged, skipped)"
+            emit("sync", details)
 
     return results
 
@@ -956,21 +1393,33 @@ def config_name_for_run(run_id: str) -> Optional[str]:
 
 
 def _parse_events_log(run_id: str) -> dict:
-    """Parse events.log for config, branch, start time."""
+    """Parse events.log for config, branch, start time.
+
+    Reads the session.json summary written by log_event when present;
+    runs that predate it fall back to scanning events.log.
+    """
     events_log = RUNS_DIR / run_id / "events.log"
     info = {"run_id": run_id, "config": "?", "branch": "?", "started": ""}
+    try:
+        summary = json.loads((RUNS_DIR / run_id / "session.json").read_bytes())
+        info.update({k: summary[k] for k in ("config", "branch", "started")})
+        return info
+    except (OSError, ValueError, KeyError):
+        pass
     if not events_log.exists():
         return info
-    for line in events_log.read_text().strip().split("\n"):
-        parts = line.split()
-        if len(parts) >= 2 and parts[1] == "start":
-            info["started"] = parts[0]
-            for p in parts[2:]:
-                if p.startswith("config="):
-                    info["config"] = p.split("=", 1)[1]
-                elif p.startswith("branch="):
-                    info["branch"] = p.split("=", 1)[1]
-            break
+    # Only the first start line matters — usually line one, so stop there
+    with open(events_log) as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1] == "start":
+                info["started"] = parts[0]
+                for p in parts[2:]:
+                    if p.startswith("config="):
+                        info["config"] = p.split("=", 1)[1]
+                    elif p.startswith("branch="):
+                        info["branch"] = p.split("=", 1)[1]
+                break
     return info
 
 
@@ -981,37 +1430,51 @@ def _has_workspace_or_worktrees(run_id: str) -> bool:
 
 def get_all_sessions() -> list[dict]:
     """Get all sessions with container state. Sorted most-recent-first."""
+    import docker
+
     _migrate_worktrees()
     sessions = {}
 
+    # One list call for every managed container, running or not
+    try:
+        client = _docker_client()
+        all_containers = client.containers.list(
+            all=True, filters={"label": "scad.managed=true"}
+        )
+    except docker.errors.DockerException:
+        all_containers = []
+    containers = {c.name: c for c in all_containers}
+
     # 1. Running containers (from Docker)
-    for c in list_scad_containers():
-        run_id = c["run_id"]
+    for c in all_containers:
+        if c.status != "running":
+            continue
+        labels = c.labels
+        run_id = labels.get("scad.run_id", "?")
         has_clones = _has_workspace_or_worktrees(run_id)
         sessions[run_id] = {
             "run_id": run_id,
-            "config": c["config"],
-            "branch": c["branch"],
-            "started": c["started"],
+            "config": labels.get("scad.config", "?"),
+            "branch": labels.get("scad.branch", "?"),
+            "started": labels.get("scad.started", ""),
             "container": "running",
             "clones": "yes" if has_clones else "-",
         }
 
     # 2. Scan runs dir for all sessions
     if RUNS_DIR.exists():
-        for d in RUNS_DIR.iterdir():
-            if not d.is_dir() or d.name in sessions:
-                continue
-            run_id = d.name
+        with os.scandir(RUNS_DIR) as it:
+            run_ids = [e.name for e in it if e.is_dir() and e.name not in sessions]
+
+        for run_id in run_ids:
             info = _parse_events_log(run_id)
 
             # Determine container state
-            try:
-                client = docker.from_env()
-                container = client.containers.get(f"scad-{run_id}")
-                container_state = "stopped" if container.status != "running" else "running"
-            except (DockerNotFound, DockerException):
+            container = containers.get(f"scad-{run_id}")
+            if container is None:
                 container_state = "removed"
+            else:
+                container_state = "stopped" if container.status != "running" else "running"
 
             has_clones = _has_workspace_or_worktrees(run_id)
 
@@ -1031,8 +1494,35 @@ def get_all_sessions() -> list[dict]:
     return sorted(sessions.values(), key=lambda x: x.get("started", ""), reverse=True)
 
 
+def _walk_jsonl(root: Path):
+    """Yield (depth, parent_dir_name, DirEntry) for every .jsonl file under root.
+
+    Single scandir pass over the tree; depth is 0 for files directly in root.
+    """
+    stack = [(str(root), 0)]
+    while stack:
+        path, depth = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, depth + 1))
+                elif entry.name.endswith(".jsonl") and entry.is_file():
+                    yield depth, os.path.basename(path), entry
+
+
+def _read_log_lines(path: Path) -> list[str]:
+    """Non-blank lines of a log file, streamed; empty if the file is missing."""
+    try:
+        with open(path) as f:
+            return [line.rstrip("\n") for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
 def get_session_info(run_id: str) -> dict:
     """Assemble session dashboard from multiple sources."""
+    import docker
+
     run_dir = RUNS_DIR / run_id
     if not run_dir.exists():
         raise FileNotFoundError(f"No session found for {run_id}")
@@ -1040,28 +1530,20 @@ def get_session_info(run_id: str) -> dict:
     info = _parse_events_log(run_id)
 
     # Events list
-    events_log = run_dir / "events.log"
-    info["events"] = []
-    if events_log.exists():
-        info["events"] = [
-            line for line in events_log.read_text().strip().split("\n") if line
-        ]
+    info["events"] = _read_log_lines(run_dir / "events.log")
 
     # Container-side events (from entrypoint)
-    container_events_log = SCAD_DIR / "logs" / f"{run_id}.events.log"
-    if container_events_log.exists():
-        container_events = [
-            line for line in container_events_log.read_text().strip().split("\n") if line
-        ]
+    container_events = _read_log_lines(LOGS_DIR / f"{run_id}.events.log")
+    if container_events:
         info["events"].extend(container_events)
         info["events"].sort()
 
     # Container state
     try:
-        client = docker.from_env()
+        client = _docker_client()
         container = client.containers.get(f"scad-{run_id}")
         info["container"] = container.status
-    except (DockerNotFound, DockerException):
+    except docker.errors.DockerException:
         info["container"] = "removed" if _has_workspace_or_worktrees(run_id) else "cleaned"
 
     # Clone paths — check workspace first, fall back to worktrees
@@ -1069,62 +1551,49 @@ def get_session_info(run_id: str) -> dict:
     if not clone_dir.exists():
         clone_dir = RUNS_DIR / run_id / "worktrees"
     if clone_dir.exists():
-        info["clones"] = sorted(d.name for d in clone_dir.iterdir() if d.is_dir())
+        with os.scandir(clone_dir) as it:
+            info["clones"] = sorted(e.name for e in it if e.is_dir())
         info["clones_path"] = str(clone_dir)
     else:
         info["clones"] = []
         info["clones_path"] = None
 
-    # Claude sessions — glob for .jsonl files in run_dir/claude/projects/
+    # Claude sessions — .jsonl files directly under each run_dir/claude/projects/<project>/,
+    # subagent transcripts under any nested subagents/ dir
     claude_projects = run_dir / "claude" / "projects"
     info["claude_sessions"] = []
     info["subagent_count"] = 0
     if claude_projects.exists():
-        for project_dir in claude_projects.iterdir():
-            if not project_dir.is_dir():
-                continue
-            for jsonl in project_dir.glob("*.jsonl"):
-                stat = jsonl.stat()
+        for depth, parent_name, entry in _walk_jsonl(claude_projects):
+            if depth == 1:
                 info["claude_sessions"].append({
-                    "id": jsonl.stem,
-                    "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M"),
+                    "id": entry.name.removesuffix(".jsonl"),
+                    "modified": time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.stat().st_mtime)),
                 })
-            for subagent_dir in project_dir.rglob("subagents"):
-                if subagent_dir.is_dir():
-                    info["subagent_count"] += len(list(subagent_dir.glob("*.jsonl")))
+            elif parent_name == "subagents":
+                info["subagent_count"] += 1
 
     return info
 
 
-def _normalize_ccusage(data: dict) -> dict:
-    """Normalize ccusage output to standard keys."""
-    if "total_input_tokens" in data:
-        return data
-    return {
-        "total_input_tokens": data.get("inputTokens", 0),
-        "total_output_tokens": data.get("outputTokens", 0),
-        "total_turns": data.get("turns", 0),
-        "total_cost": data.get("costUsd", 0),
-        "cache_creation_tokens": data.get("cacheCreationTokens", 0),
-        "cache_read_tokens": data.get("cacheReadTokens", 0),
-        "model": data.get("model"),
-        "last_activity": data.get("lastActivity"),
-    }
+def _newest_jsonl_mtime(claude_dir: Path) -> Optional[int]:
+    """Latest mtime (ns) of any session transcript, or None if there are none."""
+    # Transcripts only live under projects/; the rest of claude/ is config
+    projects = claude_dir / "projects"
+    if not projects.is_dir():
+        return None
+    return max(
+        (entry.stat().st_mtime_ns for _, _, entry in _walk_jsonl(projects)),
+        default=None,
+    )
 
 
-def get_session_usage(run_id: str) -> Optional[dict]:
-    """Get session usage (tokens, turns, and optionally cost).
-
-    Returns dict with total_input_tokens, total_output_tokens, total_turns, total_cost.
-    total_cost may be 0 for subscription users. Returns None if no data available.
-    """
-    claude_dir = RUNS_DIR / run_id / "claude"
-
-    # Try ccusage first
+def _run_ccusage(claude_dir: Path) -> Optional[dict]:
+    """Run ccusage for a Claude data dir and normalize its report."""
     try:
         result = subprocess.run(
             ["npx", "ccusage", "session", "--json", "--dir", str(claude_dir)],
-            capture_output=True, text=True, timeout=30,
+            capture_output=True, text=True, timeout=CCUSAGE_TIMEOUT,
         )
         if result.returncode == 0 and result.stdout.strip():
             data = json.loads(result.stdout)
@@ -1141,9 +1610,61 @@ def get_session_usage(run_id: str) -> Optional[dict]:
                 return _normalize_ccusage(data)
     except (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError):
         pass
+    return None
+
+
+# (scad key, ccusage key, default)
+_CCUSAGE_KEYS = (
+    ("total_input_tokens", "inputTokens", 0),
+    ("total_output_tokens", "outputTokens", 0),
+    ("total_turns", "turns", 0),
+    ("total_cost", "costUsd", 0),
+    ("cache_creation_tokens", "cacheCreationTokens", 0),
+    ("cache_read_tokens", "cacheReadTokens", 0),
+    ("model", "model", None),
+    ("last_activity", "lastActivity", None),
+)
+
+
+def _normalize_ccusage(data: dict) -> dict:
+    """Normalize ccusage output to standard keys."""
+    if "total_input_tokens" in data:
+        return data
+    return {new: data.get(old, default) for new, old, default in _CCUSAGE_KEYS}
+
+
+def get_session_usage(run_id: str) -> Optional[dict]:
+    """Get session usage (tokens, turns, and optionally cost).
+
+    Returns dict with total_input_tokens, total_output_tokens, total_turns, total_cost.
+    total_cost may be 0 for subscription users. Returns None if no data available.
+    """
+    claude_dir = RUNS_DIR / run_id / "claude"
+
+    # Cached ccusage result is valid until a transcript changes
+    cache_file = _usage_cache_dir() / f"{run_id}.json"
+    cache_key = _newest_jsonl_mtime(claude_dir)
+    if cache_key is not None:
+        try:
+            cached = json.loads(cache_file.read_bytes())
+            if cached.get("key") == cache_key:
+                return cached["usage"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    # Try ccusage first
+    usage = _run_ccusage(claude_dir)
+    if usage is not None:
+        if cache_key is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps({"key": cache_key, "usage": usage}))
+            except OSError:
+                pass
+        return usage
 
     # Fallback: parse stream-json final record
-    stream_log = SCAD_DIR / "logs" / f"{run_id}.stream.jsonl"
+    stream_log = LOGS_DIR / f"{run_id}.stream.jsonl"
     if stream_log.exists():
         try:
             lines = stream_log.read_text().strip().split("\n")
@@ -1165,14 +1686,37 @@ def get_session_usage(run_id: str) -> Optional[dict]:
 
 
 def get_project_status(config_name: str, include_cost: bool = False) -> dict:
-    """Aggregate status across all sessions for a config."""
+    """Aggregate status across all sessions for a config.
+
+    With include_cost, usage lookups share a USAGE_BUDGET deadline; runs
+    that miss it or fail show no usage. ccusage calls still in flight at
+    the deadline are not killed — the interpreter waits for them at exit,
+    up to CCUSAGE_TIMEOUT each, after the status has been returned.
+    """
     all_sessions = get_all_sessions()
     sessions = [s for s in all_sessions if s["config"] == config_name]
 
+    usages: dict[str, Optional[dict]] = {}
+    if include_cost and sessions:
+        # ccusage is slow and CPU-hungry — run a few at a time, bounded overall
+        executor = ThreadPoolExecutor(max_workers=4)
+        futures = {
+            executor.submit(get_session_usage, s["run_id"]): s["run_id"]
+            for s in sessions
+        }
+        done, _ = futures_wait(futures, timeout=USAGE_BUDGET)
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future in done:
+            # One unreadable run shouldn't take down the whole dashboard
+            try:
+                usages[futures[future]] = future.result()
+            except Exception:
+                pass
+
     total_cost = 0.0
     enriched = []
     for s in sessions:
-        usage = get_session_usage(s["run_id"]) if include_cost else None
+        usage = usages.get(s["run_id"])
         cost = usage["total_cost"] if usage else 0.0
         total_cost += cost
         enriched.append({
@@ -1202,29 +1746,62 @@ def get_project_status(config_name: str, include_cost: bool = False) -> dict:
     }
 
 
+def _claude_dir_mount(container) -> Optional[Path]:
+    """Host source of the container's ~/.claude bind mount, if it has one."""
+    for mount in container.attrs.get("Mounts") or []:
+        if mount.get("Destination") == "/home/scad/.claude":
+            return Path(mount["Source"])
+    return None
+
+
+def _replace_private(src: Path, dst: Path) -> None:
+    """Atomically replace dst with a copy of src, never readable by others.
+
+    The copy goes to a 0600 temp file beside dst and is renamed over it, so
+    a reader sees either the old file or the complete new one.
+    """
+    fd, tmp = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f, open(src, "rb") as source:
+            shutil.copyfileobj(source, f)
+        os.replace(tmp, dst)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
 def refresh_credentials(run_id: str) -> float:
     """Push fresh credentials into a running container.
 
     Returns hours remaining on the credentials.
     Raises ClickException if credentials expired or container not running.
     """
+    import docker
+
     valid, hours = check_claude_auth()
     if not valid:
         raise click.ClickException("Credentials expired. Run: claude /login")
 
     container_name = f"scad-{run_id}"
     try:
-        client = docker.from_env()
+        client = _docker_client()
         container = client.containers.get(container_name)
-    except DockerNotFound:
+    except docker.errors.NotFound:
         raise click.ClickException(f"Container scad-{run_id} not found")
 
     if container.status != "running":
         raise click.ClickException(f"Container scad-{run_id} is not running")
 
-    container.exec_run(
-        "cp /mnt/host-claude-credentials.json /home/scad/.claude/.credentials.json"
-    )
+    # When ~/.claude is bind-mounted from the host, write the file there
+    # directly; exec a cp inside only for containers without that mount
+    claude_dir = _claude_dir_mount(container)
+    if claude_dir is not None:
+        _replace_private(CLAUDE_CREDS_PATH, claude_dir / ".credentials.json")
+    else:
+        container.exec_run(
+            "cp /mnt/host-claude-credentials.json /home/scad/.claude/.credentials.json"
+        )
 
     log_event(run_id, "refresh", "credentials")
     return hours
@@ -1298,12 +1875,28 @@ def create_branch(run_id: str, branch_name: str) -> list[str]:
     return created
 
 
+def _force_remove(container) -> None:
+    """Best-effort kill and remove of a container in one daemon call."""
+    try:
+        container.remove(force=True)
+    except Exception:
+        pass
+
+
+def _remove_image(client, image_id: str) -> None:
+    """Best-effort image removal."""
+    try:
+        client.images.remove(image_id)
+    except Exception:
+        pass
+
+
 def gc(force: bool = False) -> dict:
     """Find and optionally clean orphaned state.
 
     Returns dict with orphaned_containers, dead_run_dirs, unused_images.
     """
-    client = docker.from_env()
+    client = _docker_client()
     findings = {
         "orphaned_containers": [],
         "dead_run_dirs": [],
@@ -1314,41 +1907,69 @@ def gc(force: bool = False) -> dict:
     all_containers = client.containers.list(
         all=True, filters={"label": "scad.managed=true"}
     )
+    known_names = {c.name for c in all_containers}
+    # Cleanup work is mostly waiting on the daemon or the disk — run it together
+    tasks = []
     active_image_ids = set()
     for container in all_containers:
         run_id = container.name.removeprefix("scad-")
         run_dir = RUNS_DIR / run_id
-        active_image_ids.add(container.image.id)
+        # attrs already holds the inspect payload; container.image would refetch it
+        active_image_ids.add(container.attrs.get("Image"))
         if not run_dir.exists() or container.status == "exited":
             findings["orphaned_containers"].append({
                 "name": container.name,
                 "status": container.status,
             })
             if force:
-                try:
-                    container.stop(timeout=5)
-                except Exception:
-                    pass
-                try:
-                    container.remove()
-                except Exception:
-                    pass
+                tasks.append(functools.partial(_force_remove, container))
 
     # Find dead run dirs (no container, no workspace/worktrees)
+    live_run_ids = set()
     if RUNS_DIR.exists():
-        for entry in RUNS_DIR.iterdir():
-            if not entry.is_dir():
-                continue
-            run_id = entry.name
+        with os.scandir(RUNS_DIR) as it:
+            run_ids = [e.name for e in it if e.is_dir()]
+        for run_id in run_ids:
+            entry = RUNS_DIR / run_id
             has_workspace = _has_workspace_or_worktrees(run_id)
-            if not _container_exists(run_id) and not has_workspace:
+            if f"scad-{run_id}" not in known_names and not has_workspace:
                 findings["dead_run_dirs"].append(str(entry))
                 if force:
-                    shutil.rmtree(entry)
+                    tasks.append(functools.partial(shutil.rmtree, entry))
+            else:
+                live_run_ids.add(run_id)
+
+    # Usage cache entries outlive their runs unless swept
+    if force:
+        try:
+            with os.scandir(_usage_cache_dir()) as it:
+                stale = [Path(e.path) for e in it if e.name.removesuffix(".json") not in live_run_ids]
+        except FileNotFoundError:
+            stale = []
+        for path in stale:
+            tasks.append(functools.partial(path.unlink, missing_ok=True))
+
+    # Leftovers from interrupted background deletes; recent entries may
+    # still be in the middle of another process's delete
+    trash = _trash_dir()
+    if trash.exists():
+        cutoff = time.time() - TRASH_GRACE
+        leftovers = []
+        with os.scandir(trash) as it:
+            for e in it:
+                try:
+                    if e.stat(follow_symlinks=False).st_mtime < cutoff:
+                        leftovers.append(e.path)
+                except FileNotFoundError:
+                    pass
+        for path in leftovers:
+            findings["dead_run_dirs"].append(path)
+            if force:
+                tasks.append(functools.partial(shutil.rmtree, path, ignore_errors=True))
 
     # Find unused images (scad-* tagged, not used by any container)
     try:
-        all_images = client.images.list()
+        all_images = client.images.list(filters={"reference": "scad-*"})
         for image in all_images:
             scad_tags = [t for t in (image.tags or []) if t.startswith("scad-")]
             if scad_tags and image.id not in active_image_ids:
@@ -1357,13 +1978,14 @@ def gc(force: bool = False) -> dict:
                     "id": image.id[:12],
                 })
                 if force:
-                    try:
-                        client.images.remove(image.id)
-                    except Exception:
-                        pass
+                    tasks.append(functools.partial(_remove_image, client, image.id))
     except Exception:
         pass
 
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+            list(executor.map(lambda task: task(), tasks))
+
     return findings
 
 
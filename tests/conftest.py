@@ -0,0 +1,24 @@
+"""Shared test fixtures."""
+
+import pytest
+from click.testing import CliRunner
+
+from scad.container import _docker_client, _host_paths, _scad_image_created
+
+
+@pytest.fixture(autouse=True)
+def _fresh_docker_client():
+    """Drop cached process-wide state so each test sees its own mocks."""
+    _docker_client.cache_clear()
+    _host_paths.cache_clear()
+    _scad_image_created.cache_clear()
+    yield
+    _docker_client.cache_clear()
+    _host_paths.cache_clear()
+    _scad_image_created.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """CliRunner isolates each invoke(), so one instance serves every test."""
+    return CliRunner()
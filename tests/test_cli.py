@@ -2,7 +2,6 @@
 
 import pytest
 import click
-from click.testing import CliRunner
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -10,11 +9,6 @@ import docker
 from scad.cli import main, _complete_run_ids, _complete_config_names, _relative_time, get_all_sessions, get_project_status, get_session_usage
 
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
-
 class TestRelativeTime:
     def test_just_now(self):
         from datetime import datetime, timezone
@@ -200,7 +194,7 @@ class TestSessionLogsHumanReadable:
     """Tests for session logs --job human-readable output."""
 
     @patch("scad.cli.validate_run_id")
-    def test_job_logs_show_tool_activity(self, mock_validate, tmp_path):
+    def test_job_logs_show_tool_activity(self, mock_validate, tmp_path, runner):
         """session logs --job shows condensed tool activity."""
         import json
         logs_dir = tmp_path / "logs"
@@ -221,7 +215,6 @@ class TestSessionLogsHumanReadable:
         stream_file = logs_dir / "test-run-job-001.stream.jsonl"
         stream_file.write_text("\n".join(json.dumps(r) for r in records))
 
-        runner = CliRunner()
         with patch("scad.cli.SCAD_DIR", tmp_path):
             result = runner.invoke(main, ["session", "logs", "test-run", "--job", "test-run-job-001"])
 
@@ -232,7 +225,7 @@ class TestSessionLogsHumanReadable:
         assert "All done" in result.output
 
     @patch("scad.cli.validate_run_id")
-    def test_job_logs_still_running(self, mock_validate, tmp_path):
+    def test_job_logs_still_running(self, mock_validate, tmp_path, runner):
         """session logs --job with no result record shows 'still running'."""
         import json
         logs_dir = tmp_path / "logs"
@@ -246,7 +239,6 @@ class TestSessionLogsHumanReadable:
         stream_file = logs_dir / "test-run-job-001.stream.jsonl"
         stream_file.write_text("\n".join(json.dumps(r) for r in records))
 
-        runner = CliRunner()
         with patch("scad.cli.SCAD_DIR", tmp_path):
             result = runner.invoke(main, ["session", "logs", "test-run", "--job", "test-run-job-001"])
 
@@ -329,6 +321,7 @@ class TestScadBuild:
         assert "Step 1/5" in result.output
         assert "Step 2/5" in result.output
         assert "abc123" not in result.output  # non-Step lines hidden
+        mock_build.assert_called_once_with(mock_config, rebuild=True)
 
     @patch("scad.cli.build_image")
     @patch("scad.cli.load_config")
@@ -346,10 +339,16 @@ class TestScadBuild:
         assert "Step 1/5" in result.output
         assert "abc123" in result.output
 
+
+class TestConfigNotFound:
+    @pytest.mark.parametrize("args", [
+        ["build", "bad"],
+        ["session", "start", "bad", "--tag", "test"],
+    ])
     @patch("scad.cli.load_config")
-    def test_build_config_not_found(self, mock_load, runner):
+    def test_config_not_found(self, mock_load, runner, args):
         mock_load.side_effect = FileNotFoundError("Config 'bad' not found")
-        result = runner.invoke(main, ["build", "bad"])
+        result = runner.invoke(main, args)
         assert result.exit_code != 0
         assert "not found" in result.output.lower()
 
@@ -360,13 +359,6 @@ class TestSessionStart:
         assert result.exit_code != 0
         assert "Missing argument" in result.output or "config" in result.output.lower()
 
-    @patch("scad.cli.load_config")
-    def test_start_config_not_found(self, mock_load, runner):
-        mock_load.side_effect = FileNotFoundError("Config 'bad' not found")
-        result = runner.invoke(main, ["session", "start", "bad", "--tag", "test"])
-        assert result.exit_code != 0
-        assert "not found" in result.output.lower()
-
     @patch("scad.cli.run_agent")
     @patch("scad.cli.resolve_branch")
     @patch("scad.cli.load_config")
@@ -568,7 +560,7 @@ class TestRunAgentInjectIntegration:
 
 class TestSessionAttach:
     @patch("scad.cli._subprocess.run")
-    @patch("scad.cli.docker.from_env")
+    @patch("docker.from_env")
     def test_attach_runs_docker_exec(self, mock_docker, mock_subprocess, runner):
         mock_container = MagicMock()
         mock_container.status = "running"
@@ -586,7 +578,7 @@ class TestSessionAttach:
         assert "tmux" in call_args
 
     @patch("scad.cli.validate_run_id")
-    @patch("scad.cli.docker.from_env")
+    @patch("docker.from_env")
     def test_attach_not_found(self, mock_docker, mock_validate, runner):
         mock_client = MagicMock()
         mock_client.containers.get.side_effect = docker.errors.NotFound("nope")
@@ -596,7 +588,7 @@ class TestSessionAttach:
         assert result.exit_code != 0
         assert "No container" in result.output
 
-    @patch("scad.cli.docker.from_env")
+    @patch("docker.from_env")
     def test_attach_not_running(self, mock_docker, runner):
         mock_container = MagicMock()
         mock_container.status = "exited"
@@ -608,7 +600,7 @@ class TestSessionAttach:
         assert result.exit_code != 0
         assert "not running" in result.output.lower()
 
-    @patch("scad.cli.docker.from_env")
+    @patch("docker.from_env")
     def test_attach_headless_no_tmux(self, mock_docker, runner):
         mock_container = MagicMock()
         mock_container.status = "running"
@@ -625,9 +617,8 @@ class TestSessionAttach:
 class TestSessionClean:
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.clean_run")
-    def test_clean_removes_run(self, mock_clean, mock_validate, runner, tmp_path):
-        with patch("scad.cli.Path.home", return_value=tmp_path):
-            result = runner.invoke(main, ["session", "clean", "test-run"])
+    def test_clean_removes_run(self, mock_clean, mock_validate, runner):
+        result = runner.invoke(main, ["session", "clean", "test-run"])
 
         assert result.exit_code == 0
         assert "Cleaned" in result.output
@@ -635,10 +626,9 @@ class TestSessionClean:
 
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.clean_run")
-    def test_clean_nonexistent_is_ok(self, mock_clean, mock_validate, runner, tmp_path):
+    def test_clean_nonexistent_is_ok(self, mock_clean, mock_validate, runner):
         # clean_run is a no-op if nothing exists, so clean always succeeds
-        with patch("scad.cli.Path.home", return_value=tmp_path):
-            result = runner.invoke(main, ["session", "clean", "nonexistent"])
+        result = runner.invoke(main, ["session", "clean", "nonexistent"])
 
         assert result.exit_code == 0
         mock_clean.assert_called_once_with("nonexistent")
@@ -930,7 +920,7 @@ class TestEventLogging:
 
     @patch("scad.cli.log_event")
     @patch("scad.cli._subprocess.run")
-    @patch("scad.cli.docker.from_env")
+    @patch("docker.from_env")
     def test_attach_logs_event(self, mock_docker, mock_subprocess, mock_log, runner):
         """session attach logs an attach event."""
         mock_container = MagicMock()
@@ -1200,6 +1190,21 @@ class TestBulkOperations:
         assert result.exit_code == 0
         assert len(stopped) == 2
 
+    def test_stop_all_stops_concurrently(self, runner, monkeypatch):
+        import threading
+        sessions = [
+            {"run_id": f"demo-{i}", "config": "demo", "container": "running"}
+            for i in range(3)
+        ]
+        monkeypatch.setattr("scad.cli.get_all_sessions", lambda: sessions)
+        barrier = threading.Barrier(3, timeout=5)
+        monkeypatch.setattr("scad.cli.stop_container", lambda rid: barrier.wait() is not None)
+        monkeypatch.setattr("scad.cli.log_event", lambda *a, **kw: None)
+
+        result = runner.invoke(main, ["session", "stop", "--all", "--yes"])
+        assert result.exit_code == 0
+        assert result.output.count("Stopped:") == 3
+
     def test_requires_confirmation_without_yes(self, runner, monkeypatch):
         sessions = [{"run_id": "demo-a", "config": "demo", "container": "stopped"}]
         monkeypatch.setattr("scad.cli.get_all_sessions", lambda: sessions)
@@ -1269,13 +1274,12 @@ class TestCrashDetection:
 
     @patch("scad.cli.list_scad_containers")
     @patch("scad.cli.get_recently_crashed")
-    def test_status_shows_crashed(self, mock_crashed, mock_running):
+    def test_status_shows_crashed(self, mock_crashed, mock_running, runner):
         """scad status shows recently crashed sessions."""
         mock_running.return_value = []
         mock_crashed.return_value = [
             {"run_id": "demo-test-Mar03-1200", "exit_code": 1, "finished": "2m ago"}
         ]
-        runner = CliRunner()
         result = runner.invoke(main, ["status"])
         assert "crashed" in result.output.lower() or "exit" in result.output.lower()
 
@@ -1345,3 +1349,13 @@ class TestTopLevelStatus:
         result = runner.invoke(main, ["status", "demo", "--cost"])
         assert result.exit_code == 0
         assert "$3.84" in result.output
+
+
+class TestImportCost:
+    def test_cli_import_leaves_docker_and_jinja2_unloaded(self):
+        """docker and jinja2 load only when a command actually needs them."""
+        import subprocess
+        import sys
+        code = "import sys, scad.cli; print('docker' in sys.modules, 'jinja2' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.split() == ["False", "False"]
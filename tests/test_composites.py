@@ -2,7 +2,6 @@
 import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
-from click.testing import CliRunner
 import pytest
 
 from scad.cli import main
@@ -17,7 +16,7 @@ class TestDispatch:
     @patch("scad.cli.inject_job")
     @patch("scad.cli.load_config")
     def test_dispatch_defaults_to_interactive(
-        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth
+        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, runner
     ):
         """dispatch without flags defaults to interactive (not headless)."""
         from scad.config import ScadConfig, RepoConfig
@@ -28,7 +27,6 @@ class TestDispatch:
         mock_run_agent.return_value = "demo-test-Mar03-1200"
         mock_inject.return_value = "demo-test-Mar03-1200-job-001"
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test", "--prompt", "Do the thing",
         ])
@@ -44,7 +42,7 @@ class TestDispatch:
     @patch("scad.cli.inject_job")
     @patch("scad.cli.load_config")
     def test_dispatch_headless_flag(
-        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth
+        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, runner
     ):
         """dispatch --headless enables headless + wait."""
         from scad.config import ScadConfig, RepoConfig
@@ -55,7 +53,6 @@ class TestDispatch:
         mock_run_agent.return_value = "demo-test-Mar03-1200"
         mock_inject.return_value = ("demo-test-Mar03-1200-job-001", 0)
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test", "--prompt", "Do the thing",
             "--headless",
@@ -71,7 +68,7 @@ class TestDispatch:
     @patch("scad.cli.inject_job")
     @patch("scad.cli.load_config")
     def test_dispatch_headless_no_wait(
-        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth
+        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, runner
     ):
         """dispatch --headless --no-wait dispatches headless without blocking."""
         from scad.config import ScadConfig, RepoConfig
@@ -82,7 +79,6 @@ class TestDispatch:
         mock_run_agent.return_value = "demo-test-Mar03-1200"
         mock_inject.return_value = "demo-test-Mar03-1200-job-001"
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test", "--headless", "--no-wait",
             "--prompt", "Do the thing",
@@ -98,7 +94,7 @@ class TestDispatch:
     @patch("scad.cli.inject_job")
     @patch("scad.cli.load_config")
     def test_dispatch_fetch_implies_wait(
-        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth
+        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, runner
     ):
         """dispatch --fetch forces --wait and --headless."""
         from scad.config import ScadConfig, RepoConfig
@@ -109,7 +105,6 @@ class TestDispatch:
         mock_run_agent.return_value = "demo-test-Mar03-1200"
         mock_inject.return_value = ("demo-test-Mar03-1200-job-001", 0)
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test", "--fetch",
             "--prompt", "Do the thing",
@@ -119,9 +114,8 @@ class TestDispatch:
         assert kwargs["wait"] is True
         assert kwargs["headless"] is True
 
-    def test_dispatch_fetch_no_wait_errors(self):
+    def test_dispatch_fetch_no_wait_errors(self, runner):
         """dispatch --fetch --no-wait is an error."""
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test",
             "--fetch", "--no-wait",
@@ -135,7 +129,7 @@ class TestDispatch:
     @patch("scad.cli.inject_job")
     @patch("scad.cli.load_config")
     def test_dispatch_plan_generates_prompt(
-        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, tmp_path
+        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, tmp_path, runner
     ):
         """dispatch --plan reads file and generates execution prompt."""
         from scad.config import ScadConfig, RepoConfig
@@ -149,7 +143,6 @@ class TestDispatch:
         plan_file = tmp_path / "plan.md"
         plan_file.write_text("# My Plan\n\n### Task 1: Do stuff\n")
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test", "--plan", str(plan_file),
         ])
@@ -166,22 +159,20 @@ class TestDispatch:
     @patch("scad.cli.inject_job")
     @patch("scad.cli.load_config")
     def test_dispatch_plan_and_prompt_mutually_exclusive(
-        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, tmp_path
+        self, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, tmp_path, runner
     ):
         """dispatch --plan and --prompt cannot be used together."""
         plan_file = tmp_path / "plan.md"
         plan_file.write_text("# Plan\n")
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test",
             "--plan", str(plan_file), "--prompt", "also this",
         ])
         assert result.exit_code != 0
 
-    def test_dispatch_plan_file_not_found(self):
+    def test_dispatch_plan_file_not_found(self, runner):
         """dispatch --plan with missing file errors."""
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test",
             "--plan", "/nonexistent/plan.md",
@@ -195,7 +186,7 @@ class TestDispatch:
     @patch("scad.cli.inject_job")
     @patch("scad.cli.load_config")
     def test_dispatch_builds_if_no_image(
-        self, mock_load, mock_inject, mock_run_agent, mock_build, mock_img, mock_auth
+        self, mock_load, mock_inject, mock_run_agent, mock_build, mock_img, mock_auth, runner
     ):
         """dispatch builds image if not already built."""
         from scad.config import ScadConfig, RepoConfig
@@ -207,7 +198,6 @@ class TestDispatch:
         mock_run_agent.return_value = "demo-test-Mar03-1200"
         mock_inject.return_value = "demo-test-Mar03-1200-job-001"
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "dispatch", "demo", "--tag", "test", "--prompt", "Task",
         ])
@@ -223,7 +213,7 @@ class TestHarvest:
     @patch("scad.cli.log_from_source")
     @patch("scad.cli._config_for_run")
     def test_harvest_fetches_and_logs(
-        self, mock_config, mock_log, mock_fetch, mock_validate
+        self, mock_config, mock_log, mock_fetch, mock_validate, runner
     ):
         """harvest runs fetch then shows git log."""
         from scad.config import ScadConfig, RepoConfig
@@ -234,7 +224,6 @@ class TestHarvest:
         mock_fetch.return_value = [{"repo": "code", "branch": "scad-test", "source": "/tmp/code"}]
         mock_log.return_value = {"code": "abc1234 first commit"}
 
-        runner = CliRunner()
         result = runner.invoke(main, ["harvest", "test-run"])
         assert result.exit_code == 0
         mock_fetch.assert_called_once()
@@ -246,7 +235,7 @@ class TestHarvest:
     @patch("scad.cli.log_from_source")
     @patch("scad.cli._config_for_run")
     def test_harvest_no_changes(
-        self, mock_config, mock_log, mock_fetch, mock_validate
+        self, mock_config, mock_log, mock_fetch, mock_validate, runner
     ):
         """harvest with no changes shows message."""
         from scad.config import ScadConfig, RepoConfig
@@ -256,7 +245,6 @@ class TestHarvest:
         mock_fetch.return_value = []
         mock_log.return_value = {}
 
-        runner = CliRunner()
         result = runner.invoke(main, ["harvest", "test-run"])
         assert result.exit_code == 0
 
@@ -265,7 +253,7 @@ class TestHarvest:
     @patch("scad.cli.log_from_source")
     @patch("scad.cli._config_for_run")
     def test_harvest_shows_log_not_diff(
-        self, mock_config, mock_log, mock_fetch, mock_validate
+        self, mock_config, mock_log, mock_fetch, mock_validate, runner
     ):
         """harvest shows git log --oneline by default."""
         from scad.config import ScadConfig, RepoConfig
@@ -276,7 +264,6 @@ class TestHarvest:
         mock_fetch.return_value = [{"repo": "code", "branch": "scad-test", "source": "/tmp/code"}]
         mock_log.return_value = {"code": "abc1234 first commit\ndef5678 second commit"}
 
-        runner = CliRunner()
         result = runner.invoke(main, ["harvest", "test-run"])
         assert result.exit_code == 0
         assert "abc1234" in result.output
@@ -287,7 +274,7 @@ class TestHarvest:
     @patch("scad.cli.diff_from_source")
     @patch("scad.cli._config_for_run")
     def test_harvest_diff_flag_shows_diff(
-        self, mock_config, mock_diff, mock_fetch, mock_validate
+        self, mock_config, mock_diff, mock_fetch, mock_validate, runner
     ):
         """harvest --diff shows full diff output."""
         from scad.config import ScadConfig, RepoConfig
@@ -298,7 +285,6 @@ class TestHarvest:
         mock_fetch.return_value = [{"repo": "code", "branch": "scad-test", "source": "/tmp/code"}]
         mock_diff.return_value = {"code": "+new line\n-old line"}
 
-        runner = CliRunner()
         result = runner.invoke(main, ["harvest", "test-run", "--diff"])
         assert result.exit_code == 0
         assert "+new line" in result.output
@@ -314,7 +300,7 @@ class TestFinish:
     @patch("scad.cli.clean_run")
     @patch("scad.cli._config_for_run")
     def test_finish_fetches_then_cleans(
-        self, mock_config, mock_clean, mock_diff, mock_fetch, mock_validate
+        self, mock_config, mock_clean, mock_diff, mock_fetch, mock_validate, runner
     ):
         """finish fetches before cleaning."""
         from scad.config import ScadConfig, RepoConfig
@@ -325,7 +311,6 @@ class TestFinish:
         mock_fetch.return_value = [{"repo": "code", "branch": "b", "source": "/tmp"}]
         mock_diff.return_value = {}
 
-        runner = CliRunner()
         result = runner.invoke(main, ["finish", "test-run"])
         assert result.exit_code == 0
         mock_fetch.assert_called_once()
@@ -335,7 +320,7 @@ class TestFinish:
     @patch("scad.cli.clean_run")
     @patch("scad.cli._config_for_run")
     def test_finish_no_fetch_skips_fetch(
-        self, mock_config, mock_clean, mock_validate
+        self, mock_config, mock_clean, mock_validate, runner
     ):
         """finish --no-fetch skips fetching."""
         from scad.config import ScadConfig, RepoConfig
@@ -343,7 +328,6 @@ class TestFinish:
             name="test", repos={"code": RepoConfig(path="/tmp/code", workdir=True)}
         )
 
-        runner = CliRunner()
         result = runner.invoke(main, ["finish", "test-run", "--no-fetch"])
         assert result.exit_code == 0
         mock_clean.assert_called_once()
@@ -353,7 +337,7 @@ class TestFinish:
     @patch("scad.cli.diff_from_source")
     @patch("scad.cli._config_for_run")
     def test_finish_keep_session_skips_clean(
-        self, mock_config, mock_diff, mock_fetch, mock_validate
+        self, mock_config, mock_diff, mock_fetch, mock_validate, runner
     ):
         """finish --keep-session fetches but doesn't clean."""
         from scad.config import ScadConfig, RepoConfig
@@ -363,7 +347,6 @@ class TestFinish:
         mock_fetch.return_value = []
         mock_diff.return_value = {}
 
-        runner = CliRunner()
         result = runner.invoke(main, ["finish", "test-run", "--keep-session"])
         assert result.exit_code == 0
 
@@ -378,7 +361,7 @@ class TestBatch:
     @patch("scad.cli.load_config")
     @patch("scad.cli.parse_prompt_file")
     def test_batch_runs_all_prompts(
-        self, mock_parse, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth
+        self, mock_parse, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, runner
     ):
         """batch runs inject_job for each prompt in the file."""
         from scad.config import ScadConfig, RepoConfig
@@ -390,7 +373,6 @@ class TestBatch:
         mock_parse.return_value = ["Prompt A", "Prompt B", "Prompt C"]
         mock_inject.return_value = ("demo-batch-Mar03-1200-job-001", 0)
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "batch", "demo", "--tag", "batch", "--prompt-file", "/tmp/prompts.txt",
         ])
@@ -404,7 +386,7 @@ class TestBatch:
     @patch("scad.cli.load_config")
     @patch("scad.cli.parse_prompt_file")
     def test_batch_reports_summary(
-        self, mock_parse, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth
+        self, mock_parse, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, runner
     ):
         """batch prints pass/fail summary."""
         from scad.config import ScadConfig, RepoConfig
@@ -420,7 +402,6 @@ class TestBatch:
             ("demo-batch-Mar03-1200-job-002", 1),
         ]
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "batch", "demo", "--tag", "batch", "--prompt-file", "/tmp/prompts.txt",
         ])
@@ -435,7 +416,7 @@ class TestBatch:
     @patch("scad.cli.load_config")
     @patch("scad.cli.parse_prompt_file")
     def test_batch_fail_fast_stops_early(
-        self, mock_parse, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth
+        self, mock_parse, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, runner
     ):
         """batch --fail-fast cancels remaining jobs on first failure."""
         from scad.config import ScadConfig, RepoConfig
@@ -453,7 +434,6 @@ class TestBatch:
             ("job-004", 0),
         ]
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "batch", "demo", "--tag", "batch",
             "--prompt-file", "/tmp/prompts.txt",
@@ -463,9 +443,8 @@ class TestBatch:
         # With parallel=1 and fail-fast, should stop after first failure
         assert mock_inject.call_count < 4
 
-    def test_batch_requires_prompt_file(self):
+    def test_batch_requires_prompt_file(self, runner):
         """batch without --prompt-file errors."""
-        runner = CliRunner()
         result = runner.invoke(main, [
             "batch", "demo", "--tag", "test",
         ])
@@ -478,7 +457,7 @@ class TestBatch:
     @patch("scad.cli.load_config")
     @patch("scad.cli.parse_prompt_file")
     def test_batch_parallel_flag(
-        self, mock_parse, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth
+        self, mock_parse, mock_load, mock_inject, mock_run_agent, mock_img, mock_auth, runner
     ):
         """batch --parallel N limits concurrency."""
         from scad.config import ScadConfig, RepoConfig
@@ -490,7 +469,6 @@ class TestBatch:
         mock_parse.return_value = ["A", "B"]
         mock_inject.return_value = ("job-001", 0)
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "batch", "demo", "--tag", "batch",
             "--prompt-file", "/tmp/prompts.txt",
@@ -5,17 +5,17 @@ import subprocess
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
+from datetime import datetime, timezone
 
 import click
 from scad.config import ScadConfig, RepoConfig, PythonConfig, ClaudeConfig
 import docker
+from jinja2 import Environment, PackageLoader
 import time as _time
 
 from scad.container import (
-    render_build_context,
     generate_run_id,
     generate_branch_name,
-    check_branch_exists,
     check_claude_auth,
     resolve_branch,
     create_clones,
@@ -38,7 +38,13 @@ from scad.container import (
     refresh_credentials,
     validate_run_id,
     _migrate_worktrees,
+    _alternate_object_dirs,
+    _all_branches,
+    _build_context_files,
+    _get_jinja_env,
+    _tpl,
     get_image_info,
+    image_exists,
     get_recently_crashed,
 )
 
@@ -53,64 +59,75 @@ def sample_config():
     )
 
 
-class TestRenderBuildContext:
-    def test_creates_dockerfile(self, sample_config, tmp_path):
-        render_build_context(sample_config, tmp_path)
-        dockerfile = tmp_path / "Dockerfile"
-        assert dockerfile.exists()
-        content = dockerfile.read_text()
-        assert "FROM python:3.11-slim" in content
+class TestBuildContextFiles:
+    def test_creates_dockerfile(self, sample_config):
+        files = _build_context_files(sample_config)
+        assert "FROM python:3.11-slim" in files["Dockerfile"].decode()
 
-    def test_creates_entrypoint(self, sample_config, tmp_path):
-        render_build_context(sample_config, tmp_path)
-        entrypoint = tmp_path / "entrypoint.sh"
-        assert entrypoint.exists()
-        content = entrypoint.read_text()
+    def test_creates_entrypoint(self, sample_config):
+        content = _build_context_files(sample_config)["entrypoint.sh"].decode()
         assert "cd /workspace/code" in content
         assert "git clone" not in content
 
-    def test_creates_bootstrap_files(self, sample_config, tmp_path):
-        render_build_context(sample_config, tmp_path)
-        assert (tmp_path / "bootstrap-claude.sh").exists()
-        assert (tmp_path / "bootstrap-claude.conf").exists()
-        conf = (tmp_path / "bootstrap-claude.conf").read_text()
-        assert "superpowers@claude-plugins-official" in conf
+    def test_creates_bootstrap_files(self, sample_config):
+        files = _build_context_files(sample_config)
+        assert "bootstrap-claude.sh" in files
+        assert "superpowers@claude-plugins-official" in files["bootstrap-claude.conf"].decode()
 
-    def test_copies_requirements(self, sample_config, tmp_path):
+    def test_copies_requirements(self, sample_config):
         # Create a fake requirements.txt in a fake repo
         fake_repo = Path(sample_config.repos["code"].path)
         fake_repo.mkdir(parents=True, exist_ok=True)
         (fake_repo / "requirements.txt").write_text("numpy\n")
 
-        render_build_context(sample_config, tmp_path)
-        req_file = tmp_path / "requirements.txt"
-        assert req_file.exists()
-        assert "numpy" in req_file.read_text()
+        files = _build_context_files(sample_config)
+        assert "numpy" in files["requirements.txt"].decode()
 
-    def test_no_requirements_file(self, tmp_path):
+    def test_no_requirements_file(self):
         config = ScadConfig(
             name="test",
             repos={"code": {"path": "/tmp/fake2", "workdir": True}},
         )
-        render_build_context(config, tmp_path)
-        assert not (tmp_path / "requirements.txt").exists()
+        assert "requirements.txt" not in _build_context_files(config)
 
-    def test_creates_seed_claude_json(self, sample_config, tmp_path):
-        render_build_context(sample_config, tmp_path)
-        seed = tmp_path / "seed-claude.json"
-        assert seed.exists()
-        data = json.loads(seed.read_text())
+    def test_creates_seed_claude_json(self, sample_config):
+        data = json.loads(_build_context_files(sample_config)["seed-claude.json"])
         assert data["hasCompletedOnboarding"] is True
         assert "includeCoAuthoredBy" not in data
 
-    def test_creates_seed_settings_json(self, sample_config, tmp_path):
-        render_build_context(sample_config, tmp_path)
-        seed = tmp_path / "seed-settings.json"
-        assert seed.exists()
-        data = json.loads(seed.read_text())
+    def test_creates_seed_settings_json(self, sample_config):
+        data = json.loads(_build_context_files(sample_config)["seed-settings.json"])
         assert data["attribution"] == {"commit": "", "pr": ""}
         assert "enabledPlugins" in data
 
+    def test_templates_loaded_once(self, sample_config):
+        with patch("jinja2.PackageLoader", wraps=PackageLoader) as loader:
+            _get_jinja_env.cache_clear()
+            _tpl.cache_clear()
+            first = _build_context_files(sample_config)
+            second = _build_context_files(sample_config)
+        loader.assert_called_once()
+        assert first == second
+
+    def test_compiled_templates_cached_on_disk(self, sample_config, tmp_path, monkeypatch):
+        """A fresh environment loads compiled bytecode instead of recompiling."""
+        from jinja2 import FileSystemBytecodeCache
+        monkeypatch.setattr(
+            "jinja2.FileSystemBytecodeCache",
+            lambda: FileSystemBytecodeCache(str(tmp_path)),
+        )
+        _get_jinja_env.cache_clear()
+        _tpl.cache_clear()
+        first = _build_context_files(sample_config)
+        assert any(tmp_path.iterdir())
+
+        _get_jinja_env.cache_clear()
+        _tpl.cache_clear()
+        with patch.object(Environment, "compile", side_effect=AssertionError("recompiled")):
+            assert _build_context_files(sample_config) == first
+        _get_jinja_env.cache_clear()
+        _tpl.cache_clear()
+
 
 class TestGenerateRunId:
     def test_format_with_tag(self):
@@ -129,6 +146,13 @@ class TestGenerateRunId:
         run_id = generate_run_id("demo", "notag")
         assert "demo-notag-" in run_id
 
+    def test_matches_strftime_in_c_locale(self):
+        when = datetime(2026, 3, 7, 9, 5)
+        with patch("scad.container.datetime") as mock_dt:
+            mock_dt.now.return_value = when
+            run_id = generate_run_id("demo", "notag")
+        assert run_id == f"demo-notag-{when:%b%d-%H%M}" == "demo-notag-Mar07-0905"
+
 
 class TestBranchManagement:
     def test_generate_branch_name_format(self):
@@ -152,18 +176,46 @@ class TestBranchManagement:
         assert parts[1] == "demo"
         assert parts[2] == "plan08"
 
-    @patch("scad.container.subprocess.run")
-    def test_check_branch_exists_true(self, mock_run):
-        mock_run.return_value = MagicMock(stdout="  plan-22\n")
-        assert check_branch_exists(Path("/tmp/repo"), "plan-22") is True
+    def test_all_branches_follows_gitdir_file(self, tmp_path):
+        repo = tmp_path / "repo"
+        subprocess.run(["git", "init", str(repo)], check=True, capture_output=True)
+        subprocess.run(["git", "-C", str(repo), "commit", "--allow-empty", "-m", "init"], check=True, capture_output=True)
+        linked = tmp_path / "linked"
+        subprocess.run(
+            ["git", "-C", str(repo), "worktree", "add", "-b", "side", str(linked)],
+            check=True, capture_output=True,
+        )
+        assert (linked / ".git").is_file()
+        with patch("scad.container.subprocess.run") as mock_run:
+            assert "side" in _all_branches(linked)
+        mock_run.assert_not_called()
+
+    def test_all_branches_reads_refs_without_git(self, tmp_path):
+        repo = tmp_path / "repo"
+        subprocess.run(["git", "init", "-b", "main", str(repo)], check=True, capture_output=True)
+        subprocess.run(["git", "-C", str(repo), "commit", "--allow-empty", "-m", "init"], check=True, capture_output=True)
+        subprocess.run(["git", "-C", str(repo), "branch", "packed/one"], check=True, capture_output=True)
+        subprocess.run(["git", "-C", str(repo), "pack-refs", "--all"], check=True, capture_output=True)
+        subprocess.run(["git", "-C", str(repo), "branch", "nested/loose"], check=True, capture_output=True)
+
+        with patch("scad.container.subprocess.run") as mock_run:
+            assert _all_branches(repo) == {"main", "packed/one", "nested/loose"}
+        mock_run.assert_not_called()
+
+    def test_all_branches_without_refs_heads(self, tmp_path):
+        repo = tmp_path / "repo"
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        (repo / ".git" / "refs" / "heads").rmdir()
+        assert _all_branches(repo) == frozenset()
 
     @patch("scad.container.subprocess.run")
-    def test_check_branch_exists_false(self, mock_run):
-        mock_run.return_value = MagicMock(stdout="")
-        assert check_branch_exists(Path("/tmp/repo"), "plan-22") is False
+    def test_all_branches_falls_back_to_for_each_ref(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="refs/heads/main\nrefs/heads/heads/odd\n")
+        assert _all_branches(Path("/tmp/repo")) == {"main", "heads/odd"}
+        assert "for-each-ref" in mock_run.call_args[0][0]
 
-    @patch("scad.container.check_branch_exists", return_value=None)
-    def test_resolve_branch_auto_generates(self, mock_check):
+    @patch("scad.container._all_branches", return_value=frozenset())
+    def test_resolve_branch_auto_generates(self, mock_branches):
         config = ScadConfig(
             name="test",
             repos={"code": {"path": "/tmp/fake", "workdir": True, "worktree": True}},
@@ -171,9 +223,8 @@ class TestBranchManagement:
         branch = resolve_branch(config, None)
         assert branch.startswith("scad-")
 
-    @patch("scad.container.check_branch_exists")
-    def test_resolve_branch_user_collision_raises(self, mock_check):
-        mock_check.return_value = True
+    @patch("scad.container._all_branches", return_value=frozenset({"plan-22"}))
+    def test_resolve_branch_user_collision_raises(self, mock_branches):
         config = ScadConfig(
             name="test",
             repos={"code": {"path": "/tmp/fake", "workdir": True, "worktree": True}},
@@ -181,10 +232,10 @@ class TestBranchManagement:
         with pytest.raises(click.ClickException, match="already exists"):
             resolve_branch(config, "plan-22")
 
-    @patch("scad.container.check_branch_exists")
-    def test_resolve_branch_auto_collision_adds_suffix(self, mock_check):
-        # First call: collision. Second call: no collision.
-        mock_check.side_effect = [True, False]
+    @patch("scad.container.generate_branch_name", return_value="scad-test-notag-Mar01-1400")
+    @patch("scad.container._all_branches")
+    def test_resolve_branch_auto_collision_adds_suffix(self, mock_branches, _mock_name):
+        mock_branches.return_value = frozenset({"scad-test-notag-Mar01-1400"})
         config = ScadConfig(
             name="test",
             repos={"code": {"path": "/tmp/fake", "workdir": True, "worktree": True}},
@@ -192,6 +243,36 @@ class TestBranchManagement:
         branch = resolve_branch(config, None)
         assert branch.endswith("-2")
 
+    @patch("scad.container._all_branches")
+    def test_resolve_branch_checks_every_worktree_repo(self, mock_branches):
+        mock_branches.side_effect = lambda path: frozenset({"plan-22"} if path.name == "lib" else ())
+        config = ScadConfig(
+            name="test",
+            repos={
+                "code": {"path": "/tmp/fake", "workdir": True, "worktree": True},
+                "lib": {"path": "/tmp/lib", "worktree": True},
+                "ref": {"path": "/tmp/ref", "worktree": False},
+            },
+        )
+        with pytest.raises(click.ClickException, match="repo 'lib'"):
+            resolve_branch(config, "plan-22")
+        checked = {call.args[0].name for call in mock_branches.call_args_list}
+        assert checked == {"fake", "lib"}
+
+    @patch("scad.container.generate_branch_name", return_value="scad-b")
+    @patch("scad.container._all_branches")
+    def test_resolve_branch_lists_each_repo_once(self, mock_branches, _mock_name):
+        mock_branches.return_value = frozenset({"scad-b", "scad-b-2", "scad-b-3"})
+        config = ScadConfig(
+            name="test",
+            repos={
+                "code": {"path": "/tmp/fake", "workdir": True},
+                "lib": {"path": "/tmp/lib"},
+            },
+        )
+        assert resolve_branch(config, None) == "scad-b-4"
+        assert mock_branches.call_count == 2
+
 
 class TestCloneLifecycle:
     @patch("scad.container.subprocess.run")
@@ -203,15 +284,67 @@ class TestCloneLifecycle:
         with patch("scad.container.Path.home", return_value=tmp_path):
             paths = create_clones(config, "plan-22", "test-run-id")
 
-        # First call: git clone --local, second call: git checkout -b
+        # First call: git clone --local --no-checkout, second call: git checkout -b
         assert mock_run.call_count == 2
         clone_args = mock_run.call_args_list[0][0][0]
         assert "clone" in clone_args
         assert "--local" in clone_args
+        assert "--no-checkout" in clone_args
         checkout_args = mock_run.call_args_list[1][0][0]
         assert "checkout" in checkout_args
         assert "-b" in checkout_args
-        assert "plan-22" in checkout_args
+        assert checkout_args[-2:] == ["plan-22", "HEAD"]
+
+    @patch("scad.container.subprocess.run")
+    def test_create_clones_shared(self, mock_run, tmp_path, monkeypatch):
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / ".scad" / "runs")
+        config = ScadConfig(
+            name="test",
+            repos={"code": {"path": str(tmp_path / "repo"), "workdir": True, "shared": True}},
+        )
+        create_clones(config, "plan-22", "test-run-id")
+
+        clone_args = mock_run.call_args_list[0][0][0]
+        assert "--shared" in clone_args
+        assert "--local" not in clone_args
+
+    @patch("scad.container.subprocess.run")
+    def test_create_clones_cross_device_uses_shared(self, mock_run, tmp_path, monkeypatch):
+        """--local can't hardlink across filesystems; fall back to --shared."""
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / ".scad" / "runs")
+        monkeypatch.setattr("scad.container._same_device", lambda a, b: False)
+        config = ScadConfig(
+            name="test",
+            repos={"code": {"path": str(tmp_path / "repo"), "workdir": True}},
+        )
+        create_clones(config, "plan-22", "test-run-id")
+
+        clone_args = mock_run.call_args_list[0][0][0]
+        assert "--shared" in clone_args
+        assert "--local" not in clone_args
+
+    def test_shared_clone_checks_out_working_tree(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / ".scad" / "runs")
+        source = tmp_path / "source"
+        source.mkdir()
+        subprocess.run(["git", "init", str(source)], check=True, capture_output=True)
+        (source / "README.md").write_text("hello")
+        subprocess.run(["git", "-C", str(source), "add", "."], check=True, capture_output=True)
+        subprocess.run(["git", "-C", str(source), "commit", "-m", "init"], check=True, capture_output=True)
+        config = ScadConfig(
+            name="test",
+            repos={"code": {"path": str(source), "workdir": True, "shared": True}},
+        )
+        paths = create_clones(config, "plan-22", "test-run-id")
+
+        clone = paths["code"]
+        assert (clone / "README.md").read_text() == "hello"
+        status = subprocess.run(
+            ["git", "-C", str(clone), "status", "--porcelain"],
+            capture_output=True, text=True, check=True,
+        )
+        assert status.stdout == ""
+        assert _alternate_object_dirs(clone.parent) == [source.resolve() / ".git" / "objects"]
 
     @patch("scad.container.subprocess.run")
     def test_create_clones_returns_paths(self, mock_run, tmp_path, monkeypatch):
@@ -246,15 +379,50 @@ class TestCloneLifecycle:
         # Two subprocess calls for code (clone + checkout), zero for ref
         assert mock_run.call_count == 2
 
-    @patch("scad.container.shutil.rmtree")
-    def test_cleanup_clones_removes_directory(self, mock_rmtree, tmp_path, monkeypatch):
+    @patch("scad.container.subprocess.run")
+    def test_create_clones_clones_all_worktree_repos(self, mock_run, tmp_path, monkeypatch):
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / ".scad" / "runs")
+        config = ScadConfig(
+            name="test",
+            repos={
+                "code": {"path": str(tmp_path / "code"), "workdir": True, "worktree": True},
+                "lib": {"path": str(tmp_path / "lib"), "worktree": True},
+                "docs": {"path": str(tmp_path / "docs"), "worktree": True},
+            },
+        )
+        paths = create_clones(config, "plan-22", "test-run-id")
+
+        workspace = tmp_path / ".scad" / "runs" / "test-run-id" / "workspace"
+        assert paths == {k: workspace / k for k in ("code", "lib", "docs")}
+        # clone + checkout per repo
+        assert mock_run.call_count == 6
+
+    @patch("scad.container.subprocess.run")
+    def test_create_clones_propagates_clone_failure(self, mock_run, tmp_path, monkeypatch):
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / ".scad" / "runs")
+        mock_run.side_effect = subprocess.CalledProcessError(128, ["git", "clone"])
+        config = ScadConfig(
+            name="test",
+            repos={"code": {"path": str(tmp_path / "code"), "workdir": True, "worktree": True}},
+        )
+        with pytest.raises(subprocess.CalledProcessError):
+            create_clones(config, "plan-22", "test-run-id")
+
+    @patch("scad.container.threading.Thread")
+    def test_cleanup_clones_removes_directory(self, mock_thread, tmp_path, monkeypatch):
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / ".scad" / "runs")
         clone_base = tmp_path / ".scad" / "runs" / "test-run-id" / "workspace"
-        clone_base.mkdir(parents=True)
+        (clone_base / "code").mkdir(parents=True)
 
         cleanup_clones("test-run-id")
 
-        mock_rmtree.assert_called_once_with(clone_base)
+        # Moved aside immediately, deleted in the background
+        assert not clone_base.exists()
+        trash = tmp_path / ".scad" / "trash"
+        (moved,) = list(trash.iterdir())
+        assert (moved / "code").is_dir()
+        assert mock_thread.call_args.kwargs["args"] == (moved,)
+        mock_thread.return_value.start.assert_called_once()
 
     def test_cleanup_clones_noop_if_missing(self, tmp_path, monkeypatch):
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / ".scad" / "runs")
@@ -262,51 +430,165 @@ class TestCloneLifecycle:
 
 
 class TestBuildImage:
-    @patch("scad.container.docker.from_env")
-    def test_build_streams_output(self, mock_docker, sample_config, tmp_path):
-        mock_client = MagicMock()
-        mock_docker.return_value = mock_client
+    @pytest.fixture
+    def mock_client(self, monkeypatch):
+        """Docker client whose image store is a dict of tag -> image id."""
+        store = {}
+        client = MagicMock()
+        client.store = store
+
+        def get(ref):
+            if ":" not in ref:
+                ref += ":latest"
+            if ref not in store:
+                raise docker.errors.ImageNotFound(ref)
+            image = MagicMock(id=store[ref])
+            image.tag.side_effect = lambda repo, tag="latest": store.__setitem__(f"{repo}:{tag}", store[ref])
+            return image
+
+        def build(**kw):
+            store[f"{kw['tag']}:latest"] = f"sha256:{len(store)}"
+            return client.build_output
+
+        client.images.get.side_effect = get
+        client.api.build.side_effect = build
+        client.api.tag.side_effect = lambda image, repo, tag: store.__setitem__(
+            f"{repo}:{tag}", store[f"{image}:latest"]
+        )
+        client.build_output = iter([])
+        monkeypatch.setattr("docker.from_env", lambda: client)
+        return client
 
-        mock_client.api.build.return_value = iter([
+    def test_build_streams_output(self, mock_client, sample_config):
+        mock_client.build_output = iter([
             {"stream": "Step 1/5 : FROM python:3.11-slim\n"},
             {"stream": "Step 2/5 : RUN apt-get update\n"},
         ])
 
-        lines = list(build_image(sample_config, tmp_path))
+        lines = list(build_image(sample_config))
         assert len(lines) == 2
         assert "Step 1/5" in lines[0]
         mock_client.api.build.assert_called_once()
 
-    @patch("scad.container.docker.from_env")
-    def test_build_raises_on_error(self, mock_docker, sample_config, tmp_path):
-        mock_client = MagicMock()
-        mock_docker.return_value = mock_client
+    def test_build_sends_in_memory_context(self, mock_client, sample_config):
+        import tarfile
+
+        list(build_image(sample_config))
 
-        mock_client.api.build.return_value = iter([
+        kwargs = mock_client.api.build.call_args.kwargs
+        assert kwargs["custom_context"] is True
+        assert "path" not in kwargs
+        with tarfile.open(fileobj=kwargs["fileobj"]) as tar:
+            names = set(tar.getnames())
+            dockerfile = tar.extractfile("Dockerfile").read().decode()
+        files = _build_context_files(sample_config)
+        assert names == set(files)
+        assert dockerfile == files["Dockerfile"].decode()
+
+    def test_build_raises_on_error(self, mock_client, sample_config):
+        mock_client.build_output = iter([
             {"stream": "Step 1/5 : FROM python:3.11-slim\n"},
             {"error": "something went wrong"},
         ])
 
         with pytest.raises(docker.errors.BuildError):
-            list(build_image(sample_config, tmp_path))
-
-    @patch("scad.container.docker.from_env")
-    def test_build_skips_empty_lines(self, mock_docker, sample_config, tmp_path):
-        mock_client = MagicMock()
-        mock_docker.return_value = mock_client
+            list(build_image(sample_config))
 
-        mock_client.api.build.return_value = iter([
+    def test_build_skips_empty_lines(self, mock_client, sample_config):
+        mock_client.build_output = iter([
             {"stream": "Step 1/5\n"},
             {"stream": "\n"},
             {"stream": "Step 2/5\n"},
         ])
 
-        lines = list(build_image(sample_config, tmp_path))
+        lines = list(build_image(sample_config))
         assert len(lines) == 2
 
+    def test_build_tagged_with_context_hash(self, mock_client, sample_config):
+        list(build_image(sample_config))
+
+        ctx_tags = [t for t in mock_client.store if t.startswith("scad-test:ctx-")]
+        assert len(ctx_tags) == 1
+        assert mock_client.store[ctx_tags[0]] == mock_client.store["scad-test:latest"]
+
+    def test_unchanged_context_skips_build(self, mock_client, sample_config):
+        list(build_image(sample_config))
+        lines = list(build_image(sample_config))
+        assert mock_client.api.build.call_count == 1
+        assert "unchanged" in lines[0]
+
+        changed = sample_config.model_copy(update={"apt_packages": ["jq"]})
+        list(build_image(changed))
+        assert mock_client.api.build.call_count == 2
+
+    def test_rebuild_ignores_matching_context(self, mock_client, sample_config):
+        """rebuild=True builds even when the context hash is already tagged."""
+        list(build_image(sample_config))
+        lines = list(build_image(sample_config, rebuild=True))
+        assert mock_client.api.build.call_count == 2
+        assert not any("unchanged" in line for line in lines)
+
+    def test_switching_back_retags_previous_image(self, mock_client, sample_config):
+        """Returning to an earlier context re-points the tag instead of rebuilding."""
+        list(build_image(sample_config))
+        first = mock_client.store["scad-test:latest"]
+        list(build_image(sample_config.model_copy(update={"apt_packages": ["jq"]})))
+        assert mock_client.store["scad-test:latest"] != first
+
+        list(build_image(sample_config))
+        assert mock_client.api.build.call_count == 2
+        assert mock_client.store["scad-test:latest"] == first
+
+    def test_rebuilds_when_image_missing(self, mock_client, sample_config):
+        list(build_image(sample_config))
+        mock_client.store.clear()
+        list(build_image(sample_config))
+        assert mock_client.api.build.call_count == 2
+
+    def test_failed_build_not_recorded(self, mock_client, sample_config):
+        def failing_build(**kw):
+            return iter([{"error": "boom"}])
+
+        mock_client.api.build.side_effect = failing_build
+
+        for _ in range(2):
+            with pytest.raises(docker.errors.BuildError):
+                list(build_image(sample_config))
+        assert mock_client.api.build.call_count == 2
+
+
+class TestImageExists:
+    @patch("docker.from_env")
+    def test_present_and_missing(self, mock_docker, sample_config):
+        api = mock_docker.return_value.api
+        api.images.return_value = ["sha256:abc"]
+        assert image_exists(sample_config) is True
+        api.images.assert_called_once_with(name="scad-test:latest", quiet=True)
+
+        api.images.return_value = []
+        assert image_exists(sample_config) is False
+        mock_docker.return_value.images.get.assert_not_called()
+
+
+class TestDockerClientCache:
+    @patch("docker.from_env")
+    def test_client_created_once_across_calls(self, mock_from_env):
+        mock_from_env.return_value.containers.list.return_value = []
+        list_scad_containers()
+        list_scad_containers()
+        stop_container("some-run")
+        mock_from_env.assert_called_once()
+
+    @patch("docker.from_env")
+    def test_failed_construction_is_not_cached(self, mock_from_env):
+        mock_from_env.side_effect = [docker.errors.DockerException("down"), MagicMock()]
+        assert list_scad_containers() == []
+        list_scad_containers()
+        assert mock_from_env.call_count == 2
+
 
 class TestListScadContainers:
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_lists_running_containers(self, mock_docker):
         mock_container = MagicMock()
         mock_container.labels = {
@@ -325,7 +607,7 @@ class TestListScadContainers:
         assert result[0]["run_id"] == "test-Feb26-1430"
         assert result[0]["status"] == "running"
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_empty_when_none_running(self, mock_docker):
         mock_client = MagicMock()
         mock_client.containers.list.return_value = []
@@ -361,9 +643,20 @@ class TestListCompletedRuns:
         result = list_completed_runs(logs_dir=tmp_path)
         assert result == []
 
+    def test_reads_many_status_files(self, tmp_path):
+        for i in range(12):
+            (tmp_path / f"run-{i:02d}.status.json").write_text(json.dumps({"exit_code": i}))
+        (tmp_path / "run-05.stream.jsonl").write_text("{}")
+        (tmp_path / "bad.status.json").write_text("not json{{{")
+
+        result = list_completed_runs(logs_dir=tmp_path)
+        by_id = {r["run_id"]: r for r in result}
+        assert sorted(by_id) == [f"run-{i:02d}" for i in range(12)]
+        assert by_id["run-03"]["status"] == "exited(3)"
+
 
 class TestStopContainer:
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_stops_running_container(self, mock_from_env):
         mock_container = MagicMock()
         mock_from_env.return_value.containers.get.return_value = mock_container
@@ -372,7 +665,7 @@ class TestStopContainer:
         mock_container.stop.assert_called_once_with(timeout=10)
         mock_container.remove.assert_not_called()  # Changed: no remove on stop
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_returns_false_for_missing_container(self, mock_from_env):
         mock_from_env.return_value.containers.get.side_effect = (
             docker.errors.NotFound("not found")
@@ -382,7 +675,7 @@ class TestStopContainer:
 
 
 class TestRunContainerWorkspaceMounts:
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_single_workspace_mount(self, mock_docker, sample_config, tmp_path, monkeypatch):
         """run_container mounts a single workspace dir at /workspace."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
@@ -394,7 +687,7 @@ class TestRunContainerWorkspaceMounts:
 
         worktree_paths = {"code": tmp_path / "runs" / "test-run" / "workspace" / "code"}
 
-        with patch("scad.container.Path.home", return_value=tmp_path):
+        with patch("scad.container.GITCONFIG_PATH", tmp_path / ".gitconfig"):
             (tmp_path / ".scad" / "logs").mkdir(parents=True)
             run_container(sample_config, "plan-22", "test-run", worktree_paths)
 
@@ -405,7 +698,7 @@ class TestRunContainerWorkspaceMounts:
         assert ws_mount["bind"] == "/workspace"
         assert ws_mount["mode"] == "rw"
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_no_per_repo_mounts(self, mock_docker, sample_config, tmp_path, monkeypatch):
         """run_container does NOT create per-repo volume mounts."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
@@ -417,7 +710,7 @@ class TestRunContainerWorkspaceMounts:
 
         worktree_paths = {"code": tmp_path / "runs" / "test-run" / "workspace" / "code"}
 
-        with patch("scad.container.Path.home", return_value=tmp_path):
+        with patch("scad.container.GITCONFIG_PATH", tmp_path / ".gitconfig"):
             (tmp_path / ".scad" / "logs").mkdir(parents=True)
             run_container(sample_config, "plan-22", "test-run", worktree_paths)
 
@@ -427,7 +720,46 @@ class TestRunContainerWorkspaceMounts:
             if bind_info["bind"].startswith("/workspace"):
                 assert bind_info["bind"] == "/workspace"
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
+    def test_shared_clone_objects_mounted_read_only(self, mock_docker, sample_config, tmp_path, monkeypatch):
+        """Object dirs listed in a clone's alternates are mounted at the same path."""
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        mock_client = MagicMock()
+        mock_client.containers.run.return_value = MagicMock(id="abc123")
+        mock_docker.return_value = mock_client
+
+        clone = tmp_path / "runs" / "test-run" / "workspace" / "code"
+        info = clone / ".git" / "objects" / "info"
+        info.mkdir(parents=True)
+        objects = tmp_path / "src" / ".git" / "objects"
+        (info / "alternates").write_text(f"{objects}\n")
+
+        with patch("scad.container.GITCONFIG_PATH", tmp_path / ".gitconfig"):
+            (tmp_path / ".scad" / "logs").mkdir(parents=True)
+            run_container(sample_config, "plan-22", "test-run", {"code": clone})
+
+        volumes = mock_client.containers.run.call_args[1]["volumes"]
+        assert volumes[str(objects)] == {"bind": str(objects), "mode": "ro"}
+
+    @patch("docker.from_env")
+    def test_host_paths_looked_up_once(self, mock_docker, sample_config, tmp_path, monkeypatch):
+        """Gitconfig and timezone are resolved once across container launches."""
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        monkeypatch.setattr("scad.container.LOGS_DIR", tmp_path / "logs")
+        monkeypatch.setattr("scad.container.GITCONFIG_PATH", tmp_path / ".gitconfig")
+        (tmp_path / ".gitconfig").write_text("[user]\n")
+        mock_docker.return_value.containers.run.return_value.id = "abc123"
+
+        with patch("scad.claude_config.get_host_timezone", return_value="Asia/Kolkata") as tz:
+            run_container(sample_config, "plan-22", "run-a", {})
+            run_container(sample_config, "plan-22", "run-b", {})
+
+        assert tz.call_count == 1
+        kwargs = mock_docker.return_value.containers.run.call_args[1]
+        assert kwargs["environment"]["TZ"] == "Asia/Kolkata"
+        assert kwargs["volumes"][str(tmp_path / ".gitconfig")]["bind"] == "/mnt/host-gitconfig"
+
+    @patch("docker.from_env")
     def test_data_mounts_are_bind_mounts(self, mock_docker, tmp_path, monkeypatch):
         """Data mounts from config get their own Docker bind mounts."""
         from scad.config import MountConfig
@@ -447,7 +779,7 @@ class TestRunContainerWorkspaceMounts:
 
         worktree_paths = {"code": tmp_path / "runs" / "test-run" / "workspace" / "code"}
 
-        with patch("scad.container.Path.home", return_value=tmp_path):
+        with patch("scad.container.GITCONFIG_PATH", tmp_path / ".gitconfig"):
             (tmp_path / ".scad" / "logs").mkdir(parents=True)
             run_container(config, "plan-22", "test-run", worktree_paths)
 
@@ -456,7 +788,7 @@ class TestRunContainerWorkspaceMounts:
         assert volumes[str(data_dir)]["bind"] == "/data/experiments"
         assert volumes[str(data_dir)]["mode"] == "rw"
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_no_branch_name_env(self, mock_docker, sample_config, tmp_path, monkeypatch):
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
         mock_client = MagicMock()
@@ -467,7 +799,7 @@ class TestRunContainerWorkspaceMounts:
 
         worktree_paths = {"code": tmp_path / "runs" / "test-run" / "workspace" / "code"}
 
-        with patch("scad.container.Path.home", return_value=tmp_path):
+        with patch("scad.container.GITCONFIG_PATH", tmp_path / ".gitconfig"):
             (tmp_path / ".scad" / "logs").mkdir(parents=True)
             run_container(sample_config, "plan-22", "test-run", worktree_paths)
 
@@ -475,7 +807,7 @@ class TestRunContainerWorkspaceMounts:
         assert "BRANCH_NAME" not in env
         assert "RUN_ID" in env
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_no_prompt_or_headless_env(self, mock_docker, sample_config, tmp_path, monkeypatch):
         """run_container does not set AGENT_PROMPT or HEADLESS — inject handles prompts."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
@@ -487,7 +819,7 @@ class TestRunContainerWorkspaceMounts:
 
         worktree_paths = {"code": tmp_path / "runs" / "test-run" / "workspace" / "code"}
 
-        with patch("scad.container.Path.home", return_value=tmp_path):
+        with patch("scad.container.GITCONFIG_PATH", tmp_path / ".gitconfig"):
             (tmp_path / ".scad" / "logs").mkdir(parents=True)
             run_container(sample_config, "plan-22", "test-run", worktree_paths)
 
@@ -498,13 +830,17 @@ class TestRunContainerWorkspaceMounts:
 
 class TestCheckClaudeAuth:
     def test_missing_credentials(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         valid, hours = check_claude_auth()
         assert valid is False
         assert hours == 0.0
 
     def test_expired_credentials(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         expired_ms = (_time.time() - 3600) * 1000
@@ -516,7 +852,9 @@ class TestCheckClaudeAuth:
         assert hours == 0.0
 
     def test_valid_credentials(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         future_ms = (_time.time() + 4 * 3600) * 1000
@@ -528,7 +866,9 @@ class TestCheckClaudeAuth:
         assert 3.9 < hours < 4.1
 
     def test_warns_under_one_hour(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         soon_ms = (_time.time() + 1800) * 1000
@@ -539,8 +879,27 @@ class TestCheckClaudeAuth:
         assert valid is True
         assert hours < 1.0
 
+    def test_credentials_parsed_once_until_changed(self, tmp_path, monkeypatch):
+        import os
+        creds = tmp_path / ".claude" / ".credentials.json"
+        monkeypatch.setattr("scad.container.CLAUDE_CREDS_PATH", creds)
+        creds.parent.mkdir()
+        creds.write_text(json.dumps({"claudeAiOauth": {"expiresAt": (_time.time() + 3600) * 1000}}))
+        with patch("scad.container.json.loads", wraps=json.loads) as loads:
+            assert check_claude_auth()[0] is True
+            assert check_claude_auth()[0] is True
+            assert loads.call_count == 1
+
+            creds.write_text(json.dumps({"claudeAiOauth": {"expiresAt": 0}}))
+            st = creds.stat()
+            os.utime(creds, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            assert check_claude_auth()[0] is False
+            assert loads.call_count == 2
+
     def test_malformed_json(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         (creds_dir / ".credentials.json").write_text("not json")
@@ -571,7 +930,7 @@ class TestRunDirectory:
         run_dir = tmp_path / ".scad" / "runs" / "test-run-1234" / "claude"
         assert run_dir.exists()
 
-    @patch("scad.container.docker")
+    @patch("docker.from_env")
     def test_run_container_mounts_run_dir(self, mock_docker, tmp_path, monkeypatch):
         """run_container mounts ~/.scad/runs/<run-id>/claude/ as /home/scad/.claude/."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / ".scad" / "runs")
@@ -591,11 +950,11 @@ class TestRunDirectory:
 
         mock_container = MagicMock()
         mock_container.id = "abc123"
-        mock_docker.from_env.return_value.containers.run.return_value = mock_container
+        mock_docker.return_value.containers.run.return_value = mock_container
 
         run_container(config, "test-branch", "test-run", worktree_paths)
 
-        call_kwargs = mock_docker.from_env.return_value.containers.run.call_args
+        call_kwargs = mock_docker.return_value.containers.run.call_args
         volumes = call_kwargs[1]["volumes"]
         claude_mount = volumes[str(runs_dir)]
         assert claude_mount["bind"] == "/home/scad/.claude"
@@ -603,41 +962,67 @@ class TestRunDirectory:
 
 
 class TestCleanRun:
-    @patch("scad.container.docker")
+    @patch("docker.from_env")
     def test_removes_container(self, mock_docker, tmp_path, monkeypatch):
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
         mock_container = MagicMock()
-        mock_docker.from_env.return_value.containers.get.return_value = mock_container
+        mock_docker.return_value.containers.get.return_value = mock_container
         clean_run("test-run")
-        mock_container.stop.assert_called_once()
-        mock_container.remove.assert_called_once()
+        mock_container.stop.assert_not_called()
+        mock_container.remove.assert_called_once_with(force=True)
 
-    @patch("scad.container.docker")
+    @patch("docker.from_env")
     def test_removes_clones(self, mock_docker, tmp_path, monkeypatch):
         run_dir = tmp_path / "runs" / "test-run"
         clone_dir = run_dir / "workspace"
         clone_dir.mkdir(parents=True)
         (clone_dir / "somefile").touch()
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
-        mock_docker.from_env.return_value.containers.get.side_effect = docker.errors.NotFound("x")
+        mock_docker.return_value.containers.get.side_effect = docker.errors.NotFound("x")
         clean_run("test-run")
         assert not clone_dir.exists()
 
-    @patch("scad.container.docker")
+    @patch("docker.from_env")
+    def test_removes_usage_cache(self, mock_docker, tmp_path, monkeypatch):
+        cache_file = tmp_path / "cache" / "usage" / "test-run.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{}")
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        mock_docker.return_value.containers.get.side_effect = docker.errors.NotFound("x")
+        clean_run("test-run")
+        assert not cache_file.exists()
+
+    @patch("docker.from_env")
     def test_removes_run_dir(self, mock_docker, tmp_path, monkeypatch):
         run_dir = tmp_path / "runs" / "test-run"
         run_dir.mkdir(parents=True)
         (run_dir / "claude").mkdir()
         (run_dir / "fetches.log").touch()
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
-        mock_docker.from_env.return_value.containers.get.side_effect = docker.errors.NotFound("x")
+        mock_docker.return_value.containers.get.side_effect = docker.errors.NotFound("x")
         clean_run("test-run")
         assert not run_dir.exists()
 
-    @patch("scad.container.docker")
+    @patch("docker.from_env")
+    def test_removes_multi_repo_workspace_keeping_symlink_targets(self, mock_docker, tmp_path, monkeypatch):
+        workspace = tmp_path / "runs" / "test-run" / "workspace"
+        for key in ("code", "lib", "docs"):
+            (workspace / key / ".git" / "objects").mkdir(parents=True)
+            (workspace / key / ".git" / "objects" / "pack").write_text("x")
+        external = tmp_path / "ref"
+        external.mkdir()
+        (external / "keep.txt").write_text("keep")
+        (workspace / "ref").symlink_to(external)
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        mock_docker.return_value.containers.get.side_effect = docker.errors.NotFound("x")
+        clean_run("test-run")
+        assert not (tmp_path / "runs" / "test-run").exists()
+        assert (external / "keep.txt").read_text() == "keep"
+
+    @patch("docker.from_env")
     def test_succeeds_even_if_nothing_exists(self, mock_docker, tmp_path, monkeypatch):
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
-        mock_docker.from_env.return_value.containers.get.side_effect = docker.errors.NotFound("x")
+        mock_docker.return_value.containers.get.side_effect = docker.errors.NotFound("x")
         clean_run("nonexistent")  # Should not raise
 
 
@@ -951,9 +1336,63 @@ class TestLogEvent:
         import re
         assert re.match(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}", content)
 
+    def test_log_events_writes_batch_once(self, tmp_path, monkeypatch):
+        """log_events buffers events and writes them all on exit."""
+        from scad.container import log_events
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        log_file = tmp_path / "runs" / "test-run" / "events.log"
+        with log_events("test-run") as emit:
+            emit("fetch", "code feat → /source")
+            emit("fetch", "lib feat → /lib")
+            assert not log_file.exists()
+        lines = log_file.read_text().splitlines()
+        assert [l.split()[1] for l in lines] == ["fetch", "fetch"]
+        assert lines[1].endswith("lib feat → /lib")
+
+    def test_log_events_flushes_on_error(self, tmp_path, monkeypatch):
+        from scad.container import log_events
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        with pytest.raises(RuntimeError):
+            with log_events("test-run") as emit:
+                emit("sync", "code")
+                raise RuntimeError("boom")
+        assert "sync code" in (tmp_path / "runs" / "test-run" / "events.log").read_text()
+
+    def test_start_writes_session_summary(self, tmp_path, monkeypatch):
+        """The first start event writes session.json; later ones keep it."""
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        log_event("test-run", "start", "config=demo branch=feat mode=interactive")
+        log_event("test-run", "start", "config=other branch=other")
+        summary = json.loads((tmp_path / "runs" / "test-run" / "session.json").read_text())
+        assert summary["config"] == "demo"
+        assert summary["branch"] == "feat"
+        assert summary["started"]
+
+    def test_restart_of_older_run_keeps_original_start(self, tmp_path, monkeypatch):
+        """A run whose events.log predates session.json isn't summarised from a restart."""
+        from scad.container import _parse_events_log
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        run_dir = tmp_path / "runs" / "test-run"
+        run_dir.mkdir(parents=True)
+        (run_dir / "events.log").write_text("2026-03-01T14:00 start config=demo branch=feat\n")
+        log_event("test-run", "start", "config=other branch=other")
+        assert not (run_dir / "session.json").exists()
+        info = _parse_events_log("test-run")
+        assert (info["config"], info["branch"], info["started"]) == ("demo", "feat", "2026-03-01T14:00")
+
+    def test_session_summary_skips_events_log(self, tmp_path, monkeypatch):
+        """Session info comes from session.json without reading events.log."""
+        from scad.container import _parse_events_log
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        log_event("test-run", "start", "config=demo branch=feat")
+        (tmp_path / "runs" / "test-run" / "events.log").unlink()
+        info = _parse_events_log("test-run")
+        assert info["config"] == "demo"
+        assert info["branch"] == "feat"
+
 
 class TestGetAllSessions:
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_returns_running_containers(self, mock_docker, tmp_path, monkeypatch):
         """get_all_sessions includes running containers."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
@@ -976,21 +1415,24 @@ class TestGetAllSessions:
         running = [r for r in results if r["run_id"] == "demo-Feb28-1400"]
         assert running[0]["container"] == "running"
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_includes_stopped_sessions(self, mock_docker, tmp_path, monkeypatch):
         """get_all_sessions includes sessions with stopped containers."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
         mock_client = MagicMock()
-        mock_client.containers.list.return_value = []
 
         stopped_container = MagicMock()
+        stopped_container.name = "scad-demo-Feb28-1400"
         stopped_container.status = "exited"
         stopped_container.labels = {
             "scad.config": "demo",
             "scad.branch": "scad-Feb28-1400",
             "scad.started": "2026-02-28T14:00:00Z",
         }
-        mock_client.containers.get.return_value = stopped_container
+        # Only the all=True listing includes exited containers
+        mock_client.containers.list.side_effect = (
+            lambda all=False, filters=None: [stopped_container] if all else []
+        )
         mock_docker.return_value = mock_client
 
         run_dir = tmp_path / "runs" / "demo-Feb28-1400"
@@ -1004,7 +1446,7 @@ class TestGetAllSessions:
         assert len(results) == 1
         assert results[0]["container"] == "stopped"
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_includes_removed_sessions(self, mock_docker, tmp_path, monkeypatch):
         """get_all_sessions shows removed when container gone but clones exist."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
@@ -1025,7 +1467,7 @@ class TestGetAllSessions:
         assert results[0]["container"] == "removed"
         assert results[0]["clones"] == "yes"
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_includes_cleaned_sessions(self, mock_docker, tmp_path, monkeypatch):
         """get_all_sessions shows cleaned when only events.log remains."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
@@ -1046,6 +1488,24 @@ class TestGetAllSessions:
         assert results[0]["container"] == "cleaned"
         assert results[0]["clones"] == "-"
 
+    @patch("docker.from_env")
+    def test_single_container_listing_for_many_runs(self, mock_docker, tmp_path, monkeypatch):
+        """Container state for every run dir comes from one list call, not a get per run."""
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        mock_client = MagicMock()
+        mock_client.containers.list.return_value = []
+        mock_docker.return_value = mock_client
+
+        for i in range(5):
+            (tmp_path / "runs" / f"demo-Feb2{i}-1000").mkdir(parents=True)
+
+        results = get_all_sessions()
+        assert len(results) == 5
+        mock_client.containers.get.assert_not_called()
+        mock_client.containers.list.assert_called_once_with(
+            all=True, filters={"label": "scad.managed=true"}
+        )
+
 
 class TestGetSessionInfo:
     def test_basic_info_from_events_log(self, tmp_path, monkeypatch):
@@ -1058,7 +1518,7 @@ class TestGetSessionInfo:
             "2026-02-28T14:30 fetch code scad-Feb28-1400 → /src\n"
         )
 
-        with patch("scad.container.docker.from_env") as mock_docker:
+        with patch("docker.from_env") as mock_docker:
             mock_docker.return_value.containers.get.side_effect = docker.errors.NotFound("x")
             info = get_session_info("demo-Feb28-1400")
 
@@ -1074,7 +1534,7 @@ class TestGetSessionInfo:
         run_dir.mkdir(parents=True)
         (run_dir / "events.log").write_text("2026-02-28T14:00 start config=demo branch=feat\n")
 
-        with patch("scad.container.docker.from_env") as mock_docker:
+        with patch("docker.from_env") as mock_docker:
             mock_container = MagicMock()
             mock_container.status = "running"
             mock_docker.return_value.containers.get.return_value = mock_container
@@ -1092,7 +1552,7 @@ class TestGetSessionInfo:
         (clone_dir / "demo-code").mkdir(parents=True)
         (clone_dir / "demo-docs").mkdir(parents=True)
 
-        with patch("scad.container.docker.from_env") as mock_docker:
+        with patch("docker.from_env") as mock_docker:
             mock_docker.return_value.containers.get.side_effect = docker.errors.NotFound("x")
             info = get_session_info("demo-Feb28-1400")
 
@@ -1109,7 +1569,7 @@ class TestGetSessionInfo:
         projects_dir.mkdir(parents=True)
         (projects_dir / "abc12345.jsonl").write_text("{}\n")
 
-        with patch("scad.container.docker.from_env") as mock_docker:
+        with patch("docker.from_env") as mock_docker:
             mock_docker.return_value.containers.get.side_effect = docker.errors.NotFound("x")
             info = get_session_info("demo-Feb28-1400")
 
@@ -1144,7 +1604,7 @@ class TestSessionInfoSubagents:
         (subagents / "agent-1.jsonl").write_text("{}\n")
         (subagents / "agent-2.jsonl").write_text("{}\n")
 
-        with patch("scad.container.docker.from_env"):
+        with patch("docker.from_env"):
             info = get_session_info("test-run")
 
         assert len(info["claude_sessions"]) == 1
@@ -1162,19 +1622,43 @@ class TestSessionInfoSubagents:
         project_dir.mkdir(parents=True)
         (project_dir / "abc123.jsonl").write_text("{}\n")
 
-        with patch("scad.container.docker.from_env"):
+        with patch("docker.from_env"):
             info = get_session_info("test-run")
 
         assert len(info["claude_sessions"]) == 1
         assert info["subagent_count"] == 0
 
+    def test_counts_across_projects(self, tmp_path, monkeypatch):
+        """Sessions and subagents are collected from every project dir."""
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path)
+        run_dir = tmp_path / "test-run"
+        run_dir.mkdir()
+        (run_dir / "events.log").write_text("2026-03-02T14:00 start config=test branch=main\n")
+
+        projects = run_dir / "claude" / "projects"
+        for name in ("%2Fworkspace%2Fcode", "%2Fworkspace%2Flib"):
+            project_dir = projects / name
+            (project_dir / "s1" / "subagents").mkdir(parents=True)
+            (project_dir / "s1.jsonl").write_text("{}\n")
+            (project_dir / "s1" / "subagents" / "agent-1.jsonl").write_text("{}\n")
+            (project_dir / "s1" / "notes.jsonl").write_text("{}\n")
+        (projects / "stray.jsonl").write_text("{}\n")
+
+        with patch("docker.from_env"):
+            info = get_session_info("test-run")
+
+        assert sorted(s["id"] for s in info["claude_sessions"]) == ["s1", "s1"]
+        assert info["subagent_count"] == 2
+
 
 class TestRefreshCredentials:
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_copies_credentials_to_container(self, mock_docker, tmp_path, monkeypatch):
         """refresh_credentials copies host creds into container."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         future_ms = (_time.time() + 4 * 3600) * 1000
@@ -1193,11 +1677,68 @@ class TestRefreshCredentials:
         )
         assert hours > 3.0
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
+    def test_writes_credentials_through_run_claude_dir(self, mock_docker, tmp_path, monkeypatch):
+        """With the run's claude dir mounted, creds are written host-side, no exec."""
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
+        creds_dir = tmp_path / ".claude"
+        creds_dir.mkdir()
+        future_ms = (_time.time() + 4 * 3600) * 1000
+        creds = json.dumps({"claudeAiOauth": {"expiresAt": future_ms}})
+        (creds_dir / ".credentials.json").write_text(creds)
+        run_claude = tmp_path / "runs" / "test-run" / "claude"
+        run_claude.mkdir(parents=True)
+        (run_claude / ".credentials.json").write_text("stale")
+        mock_container = MagicMock()
+        mock_container.status = "running"
+        mock_container.attrs = {"Mounts": [
+            {"Source": str(run_claude), "Destination": "/home/scad/.claude"},
+        ]}
+        mock_docker.return_value.containers.get.return_value = mock_container
+
+        refresh_credentials("test-run")
+
+        written = run_claude / ".credentials.json"
+        assert written.read_text() == creds
+        assert written.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in run_claude.iterdir()] == [".credentials.json"]
+        mock_container.exec_run.assert_not_called()
+
+    @patch("docker.from_env")
+    def test_unmounted_claude_dir_uses_exec(self, mock_docker, tmp_path, monkeypatch):
+        """A run claude dir that exists on the host but isn't mounted gets the exec cp."""
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
+        creds_dir = tmp_path / ".claude"
+        creds_dir.mkdir()
+        future_ms = (_time.time() + 4 * 3600) * 1000
+        (creds_dir / ".credentials.json").write_text(
+            json.dumps({"claudeAiOauth": {"expiresAt": future_ms}})
+        )
+        run_claude = tmp_path / "runs" / "test-run" / "claude"
+        run_claude.mkdir(parents=True)
+        mock_container = MagicMock()
+        mock_container.status = "running"
+        mock_container.attrs = {"Mounts": []}
+        mock_docker.return_value.containers.get.return_value = mock_container
+
+        refresh_credentials("test-run")
+
+        assert not (run_claude / ".credentials.json").exists()
+        mock_container.exec_run.assert_called_once()
+
+    @patch("docker.from_env")
     def test_logs_refresh_event(self, mock_docker, tmp_path, monkeypatch):
         """refresh_credentials logs to events.log."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         future_ms = (_time.time() + 4 * 3600) * 1000
@@ -1215,11 +1756,13 @@ class TestRefreshCredentials:
         assert "refresh" in events_log.read_text()
         assert "credentials" in events_log.read_text()
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_raises_if_credentials_expired(self, mock_docker, tmp_path, monkeypatch):
         """refresh_credentials raises if host credentials expired."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         expired_ms = (_time.time() - 3600) * 1000
@@ -1229,11 +1772,13 @@ class TestRefreshCredentials:
         with pytest.raises(click.ClickException, match="expired"):
             refresh_credentials("test-run")
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_raises_if_container_not_running(self, mock_docker, tmp_path, monkeypatch):
         """refresh_credentials raises if container is not running."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         future_ms = (_time.time() + 4 * 3600) * 1000
@@ -1247,11 +1792,13 @@ class TestRefreshCredentials:
         with pytest.raises(click.ClickException, match="not running"):
             refresh_credentials("test-run")
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_raises_if_container_not_found(self, mock_docker, tmp_path, monkeypatch):
         """refresh_credentials raises if container doesn't exist."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(
+            "scad.container.CLAUDE_CREDS_PATH", tmp_path / ".claude" / ".credentials.json"
+        )
         creds_dir = tmp_path / ".claude"
         creds_dir.mkdir()
         future_ms = (_time.time() + 4 * 3600) * 1000
@@ -1265,7 +1812,7 @@ class TestRefreshCredentials:
 
 
 class TestRunContainerTelemetry:
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_disables_telemetry(self, mock_docker, sample_config, tmp_path, monkeypatch):
         """run_container sets telemetry disable env vars."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
@@ -1414,6 +1961,7 @@ class TestGetSessionUsage:
         """get_session_usage falls back to stream-json final record."""
         monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
         monkeypatch.setattr("scad.container.SCAD_DIR", tmp_path)
+        monkeypatch.setattr("scad.container.LOGS_DIR", tmp_path / "logs")
         run_dir = tmp_path / "runs" / "test-run" / "claude"
         run_dir.mkdir(parents=True)
 
@@ -1439,6 +1987,7 @@ class TestGetSessionUsage:
         monkeypatch.setattr("scad.container.RUNS_DIR", runs_dir)
         scad_dir = tmp_path / "scad"
         monkeypatch.setattr("scad.container.SCAD_DIR", scad_dir)
+        monkeypatch.setattr("scad.container.LOGS_DIR", scad_dir / "logs")
 
         logs_dir = scad_dir / "logs"
         logs_dir.mkdir(parents=True)
@@ -1455,6 +2004,31 @@ class TestGetSessionUsage:
         assert result["total_output_tokens"] == 3000
         assert result["total_turns"] == 10
 
+    def test_caches_ccusage_until_transcript_changes(self, tmp_path, monkeypatch):
+        """A cached ccusage result is reused until a session .jsonl changes."""
+        import os
+        monkeypatch.setattr("scad.container.RUNS_DIR", tmp_path / "runs")
+        project = tmp_path / "runs" / "test-run" / "claude" / "projects" / "-workspace"
+        project.mkdir(parents=True)
+        transcript = project / "abc.jsonl"
+        transcript.write_text("{}\n")
+
+        with patch("scad.container.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=json.dumps([{"total_cost": 1.0}]),
+            )
+            first = get_session_usage("test-run")
+            second = get_session_usage("test-run")
+            assert mock_run.call_count == 1
+            assert second == first
+
+            stat = transcript.stat()
+            os.utime(transcript, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            get_session_usage("test-run")
+            assert mock_run.call_count == 2
+
+        assert (tmp_path / "cache" / "usage" / "test-run.json").exists()
+
     def test_old_function_name_removed(self):
         """get_session_cost should not exist after rename."""
         import scad.container
@@ -1498,6 +2072,47 @@ class TestGetProjectStatus:
         status = get_project_status("demo", include_cost=True)
         assert abs(status["total_cost"] - 3.84) < 0.01
 
+    @patch("scad.container.get_all_sessions")
+    @patch("scad.container.get_session_usage")
+    def test_usage_lookups_run_concurrently(self, mock_usage, mock_sessions):
+        """Usage for several sessions is fetched in parallel, not one by one."""
+        import threading
+        mock_sessions.return_value = [
+            {"run_id": f"demo-{i}", "config": "demo", "branch": f"b{i}",
+             "started": "2026-03-01T14:00", "container": "stopped", "clones": "yes"}
+            for i in range(3)
+        ]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def usage(run_id):
+            barrier.wait()
+            return {"total_cost": 1.0}
+
+        mock_usage.side_effect = usage
+        status = get_project_status("demo", include_cost=True)
+        assert status["total_cost"] == 3.0
+
+    @patch("scad.container.get_all_sessions")
+    @patch("scad.container.get_session_usage")
+    def test_failed_usage_lookup_hides_only_that_run(self, mock_usage, mock_sessions):
+        """A usage lookup that raises leaves that run without usage, not a crash."""
+        mock_sessions.return_value = [
+            {"run_id": f"demo-{i}", "config": "demo", "branch": f"b{i}",
+             "started": "2026-03-01T14:00", "container": "stopped", "clones": "yes"}
+            for i in range(2)
+        ]
+
+        def usage(run_id):
+            if run_id == "demo-0":
+                raise PermissionError("unreadable")
+            return {"total_cost": 1.0}
+
+        mock_usage.side_effect = usage
+        status = get_project_status("demo", include_cost=True)
+        assert status["total_cost"] == 1.0
+        by_id = {s["run_id"]: s["usage"] for s in status["sessions"]}
+        assert by_id["demo-0"] is None
+
     @patch("scad.container.get_all_sessions")
     def test_no_cost_without_flag(self, mock_sessions):
         """get_project_status does not call get_session_usage without include_cost."""
@@ -1561,7 +2176,7 @@ class TestConsolidatedPaths:
         (run_dir / "claude").mkdir(parents=True)
         (run_dir / "events.log").write_text("test")
 
-        monkeypatch.setattr("scad.container.docker.from_env", lambda: MagicMock(
+        monkeypatch.setattr("docker.from_env", lambda: MagicMock(
             containers=MagicMock(get=MagicMock(side_effect=docker.errors.NotFound("not found")))
         ))
 
@@ -1682,7 +2297,7 @@ class TestGarbageCollection:
         mock_client = MagicMock()
         mock_client.containers.list.return_value = [mock_container]
         mock_client.images.list.return_value = []
-        monkeypatch.setattr("scad.container.docker.from_env", lambda: mock_client)
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
 
         findings = gc(force=False)
         assert len(findings["orphaned_containers"]) == 1
@@ -1699,12 +2314,30 @@ class TestGarbageCollection:
         mock_client = MagicMock()
         mock_client.containers.list.return_value = []
         mock_client.images.list.return_value = []
-        monkeypatch.setattr("scad.container.docker.from_env", lambda: mock_client)
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
         monkeypatch.setattr("scad.container._container_exists", lambda rid: False)
 
         findings = gc(force=False)
         assert len(findings["dead_run_dirs"]) == 1
 
+    def test_run_dirs_checked_against_one_container_listing(self, tmp_path, monkeypatch):
+        """Run dirs are matched to the single container list, not per-run lookups."""
+        runs_dir = tmp_path / "runs"
+        for run_id in ("dead-Mar01-1400", "live-Mar01-1500"):
+            (runs_dir / run_id).mkdir(parents=True)
+        monkeypatch.setattr("scad.container.RUNS_DIR", runs_dir)
+
+        live = MagicMock(status="running")
+        live.name = "scad-live-Mar01-1500"
+        mock_client = MagicMock()
+        mock_client.containers.list.return_value = [live]
+        mock_client.images.list.return_value = []
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
+
+        findings = gc(force=False)
+        assert findings["dead_run_dirs"] == [str(runs_dir / "dead-Mar01-1400")]
+        mock_client.containers.get.assert_not_called()
+
     def test_finds_unused_images(self, tmp_path, monkeypatch):
         """Image tagged scad-* with no containers using it."""
         runs_dir = tmp_path / "runs"
@@ -1719,10 +2352,30 @@ class TestGarbageCollection:
         mock_client = MagicMock()
         mock_client.containers.list.return_value = []
         mock_client.images.list.return_value = [mock_image]
-        monkeypatch.setattr("scad.container.docker.from_env", lambda: mock_client)
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
 
         findings = gc(force=False)
         assert len(findings["unused_images"]) == 1
+        mock_client.images.list.assert_called_once_with(filters={"reference": "scad-*"})
+
+    def test_image_in_use_read_from_container_attrs(self, tmp_path, monkeypatch):
+        """Images used by a container are matched via attrs, without an image lookup."""
+        runs_dir = tmp_path / "runs"
+        (runs_dir / "live-Mar01-1500").mkdir(parents=True)
+        monkeypatch.setattr("scad.container.RUNS_DIR", runs_dir)
+
+        live = MagicMock(status="running", attrs={"Image": "sha256:abc123"})
+        live.name = "scad-live-Mar01-1500"
+        mock_image = MagicMock(tags=["scad-demo:latest"], id="sha256:abc123")
+
+        mock_client = MagicMock()
+        mock_client.containers.list.return_value = [live]
+        mock_client.images.list.return_value = [mock_image]
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
+
+        findings = gc(force=False)
+        assert findings["unused_images"] == []
+        mock_client.images.get.assert_not_called()
 
     def test_dry_run_does_not_delete(self, tmp_path, monkeypatch):
         """gc(force=False) reports but doesn't clean."""
@@ -1734,7 +2387,7 @@ class TestGarbageCollection:
         mock_client = MagicMock()
         mock_client.containers.list.return_value = []
         mock_client.images.list.return_value = []
-        monkeypatch.setattr("scad.container.docker.from_env", lambda: mock_client)
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
         monkeypatch.setattr("scad.container._container_exists", lambda rid: False)
 
         gc(force=False)
@@ -1750,12 +2403,80 @@ class TestGarbageCollection:
         mock_client = MagicMock()
         mock_client.containers.list.return_value = []
         mock_client.images.list.return_value = []
-        monkeypatch.setattr("scad.container.docker.from_env", lambda: mock_client)
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
         monkeypatch.setattr("scad.container._container_exists", lambda rid: False)
 
         gc(force=True)
         assert not dead_dir.exists()
 
+    def test_sweeps_leftover_trash(self, tmp_path, monkeypatch):
+        """Trees left in trash/ by an interrupted delete are reported and removed."""
+        import os
+        runs_dir = tmp_path / "runs"
+        runs_dir.mkdir()
+        leftover = tmp_path / "trash" / "abc123"
+        (leftover / "code").mkdir(parents=True)
+        os.utime(leftover, (0, _time.time() - 2 * 3600))
+        in_progress = tmp_path / "trash" / "def456"
+        in_progress.mkdir()
+        monkeypatch.setattr("scad.container.RUNS_DIR", runs_dir)
+
+        mock_client = MagicMock()
+        mock_client.containers.list.return_value = []
+        mock_client.images.list.return_value = []
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
+
+        assert gc(force=False)["dead_run_dirs"] == [str(leftover)]
+        gc(force=True)
+        assert not leftover.exists()
+        assert in_progress.exists()
+
+    def test_force_sweeps_usage_cache_of_missing_runs(self, tmp_path, monkeypatch):
+        runs_dir = tmp_path / "runs"
+        (runs_dir / "live-Mar01-1500" / "workspace").mkdir(parents=True)
+        cache_dir = tmp_path / "cache" / "usage"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "live-Mar01-1500.json").write_text("{}")
+        (cache_dir / "gone-Mar01-1400.json").write_text("{}")
+        monkeypatch.setattr("scad.container.RUNS_DIR", runs_dir)
+
+        mock_client = MagicMock()
+        mock_client.containers.list.return_value = []
+        mock_client.images.list.return_value = []
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
+
+        gc(force=False)
+        assert (cache_dir / "gone-Mar01-1400.json").exists()
+        gc(force=True)
+        assert [p.name for p in cache_dir.iterdir()] == ["live-Mar01-1500.json"]
+
+    def test_force_cleans_containers_dirs_and_images(self, tmp_path, monkeypatch):
+        """gc(force=True) removes every finding, even when one removal fails."""
+        runs_dir = tmp_path / "runs"
+        dead_dirs = [runs_dir / f"dead-{i}" for i in range(3)]
+        for d in dead_dirs:
+            d.mkdir(parents=True)
+        monkeypatch.setattr("scad.container.RUNS_DIR", runs_dir)
+
+        orphans = []
+        for i in range(3):
+            c = MagicMock(status="exited")
+            c.name = f"scad-gone-{i}"
+            orphans.append(c)
+        orphans[0].remove.side_effect = Exception("already gone")
+        image = MagicMock(tags=["scad-old:latest"], id="sha256:old")
+
+        mock_client = MagicMock()
+        mock_client.containers.list.return_value = orphans
+        mock_client.images.list.return_value = [image]
+        monkeypatch.setattr("docker.from_env", lambda: mock_client)
+
+        gc(force=True)
+        for c in orphans:
+            c.remove.assert_called_once_with(force=True)
+        assert not any(d.exists() for d in dead_dirs)
+        mock_client.images.remove.assert_called_once_with("sha256:old")
+
 
 class TestImagePrune:
     """Build auto-removes old image for same config."""
@@ -1924,27 +2645,55 @@ class TestUnifiedWorkspace:
 class TestGetImageInfo:
     """Tests for get_image_info() — Docker image lookup."""
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_returns_info_when_image_exists(self, mock_docker):
         """get_image_info returns tag and created date when image exists."""
-        mock_image = MagicMock()
-        mock_image.attrs = {"Created": "2026-03-03T12:00:00"}
-        mock_docker.return_value.images.get.return_value = mock_image
+        created = datetime(2026, 3, 3, 12, 0, tzinfo=timezone.utc)
+        mock_docker.return_value.api.images.return_value = [
+            {"RepoTags": ["scad-demo:latest"], "Created": int(created.timestamp())},
+        ]
 
         result = get_image_info("demo")
         assert result is not None
         assert result["tag"] == "scad-demo"
-        assert result["created"] == "2026-03-03T12:00:00"
+        assert datetime.fromisoformat(result["created"]) == created
+
+    @patch("docker.from_env")
+    def test_ignores_stale_context_tags(self, mock_docker):
+        """An older ctx-tagged image in the same repo doesn't mask :latest."""
+        created = datetime(2033, 1, 1, tzinfo=timezone.utc)
+        mock_docker.return_value.api.images.return_value = [
+            {"RepoTags": ["scad-demo:latest"], "Created": int(created.timestamp())},
+            {"RepoTags": ["scad-demo:ctx-0123456789abcdef"], "Created": 978307200},
+        ]
+
+        result = get_image_info("demo")
+        assert datetime.fromisoformat(result["created"]) == created
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_returns_none_when_not_found(self, mock_docker):
         """get_image_info returns None when image doesn't exist."""
-        mock_docker.return_value.images.get.side_effect = docker.errors.ImageNotFound("nope")
+        mock_docker.return_value.api.images.return_value = []
 
         result = get_image_info("nonexistent")
         assert result is None
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
+    def test_one_listing_for_many_configs(self, mock_docker):
+        """Looking up several configs lists images once instead of inspecting each."""
+        mock_docker.return_value.api.images.return_value = [
+            {"RepoTags": ["scad-a:latest"], "Created": 0},
+            {"RepoTags": ["scad-b:latest"], "Created": 0},
+        ]
+
+        infos = [get_image_info(name) for name in ("a", "b", "c")]
+        assert [i is not None for i in infos] == [True, True, False]
+        mock_docker.return_value.api.images.assert_called_once_with(
+            filters={"reference": "scad-*"}
+        )
+        mock_docker.return_value.images.get.assert_not_called()
+
+    @patch("docker.from_env")
     def test_returns_none_on_docker_error(self, mock_docker):
         """get_image_info returns None on Docker connection error."""
         mock_docker.side_effect = docker.errors.DockerException("not running")
@@ -1956,7 +2705,7 @@ class TestGetImageInfo:
 class TestGetRecentlyCrashed:
     """Tests for get_recently_crashed() — find crashed containers."""
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_returns_crashed_containers(self, mock_docker):
         """get_recently_crashed returns containers with non-zero exit code."""
         mock_container = MagicMock()
@@ -1969,7 +2718,7 @@ class TestGetRecentlyCrashed:
         assert result[0]["run_id"] == "demo-test"
         assert result[0]["exit_code"] == 1
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_ignores_clean_exits(self, mock_docker):
         """get_recently_crashed ignores containers that exited cleanly (code 0)."""
         mock_container = MagicMock()
@@ -1980,7 +2729,7 @@ class TestGetRecentlyCrashed:
         result = get_recently_crashed()
         assert len(result) == 0
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_returns_empty_on_docker_error(self, mock_docker):
         """get_recently_crashed returns empty list on Docker error."""
         mock_docker.return_value.containers.list.side_effect = docker.errors.DockerException("err")
@@ -1988,7 +2737,7 @@ class TestGetRecentlyCrashed:
         result = get_recently_crashed()
         assert result == []
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_empty_when_no_exited_containers(self, mock_docker):
         """get_recently_crashed returns empty when no containers match."""
         mock_docker.return_value.containers.list.return_value = []
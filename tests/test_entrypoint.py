@@ -179,6 +179,15 @@ class TestDockerfileTemplate:
         rendered = self._render_dockerfile(config)
         assert "delta" in rendered
 
+    def test_requirements_installed_after_tool_layers(self):
+        """Requirements changes don't invalidate the Claude / oh-my-zsh layers."""
+        config = self._make_config()
+        config["requirements_content"] = "requests\n"
+        rendered = self._render_dockerfile(config)
+        pip_pos = rendered.index("pip install")
+        assert rendered.index("claude.ai/install.sh") < pip_pos
+        assert rendered.index("ohmyzsh") < pip_pos
+
 
 @pytest.fixture
 def rendered_entrypoint(jinja_env):
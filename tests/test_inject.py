@@ -11,7 +11,7 @@ from scad.container import inject_job, list_jobs, send_to_job, create_branch, RU
 class TestInjectJob:
     """Tests for inject_job() — docker exec into running container."""
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_headless_injection_runs_docker_exec(self, mock_docker, tmp_path):
         """Headless inject runs claude -p via docker exec."""
         mock_container = MagicMock()
@@ -34,7 +34,7 @@ class TestInjectJob:
         exec_cmd = mock_container.exec_run.call_args_list[1][0][0]
         assert "claude -p" in str(exec_cmd)
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_interactive_injection_runs_tmux(self, mock_docker, tmp_path):
         """Interactive inject creates tmux session via docker exec."""
         mock_container = MagicMock()
@@ -54,7 +54,7 @@ class TestInjectJob:
         exec_cmd = mock_container.exec_run.call_args[0][0]
         assert "tmux" in str(exec_cmd)
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_writes_job_metadata(self, mock_docker, tmp_path):
         """Inject creates job metadata JSON file."""
         mock_container = MagicMock()
@@ -79,7 +79,7 @@ class TestInjectJob:
         assert meta["mode"] == "headless"
         assert "started" in meta
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_logs_inject_event(self, mock_docker, tmp_path):
         """Inject logs to events.log."""
         mock_container = MagicMock()
@@ -102,7 +102,7 @@ class TestInjectJob:
         assert "inject" in content
         assert job_id in content
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_container_not_running_raises(self, mock_docker, tmp_path):
         """Inject raises if container is not running."""
         mock_container = MagicMock()
@@ -119,7 +119,7 @@ class TestInjectJob:
                     workdir_key="code",
                 )
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_job_id_increments(self, mock_docker, tmp_path):
         """Sequential injects get incrementing job IDs."""
         mock_container = MagicMock()
@@ -135,7 +135,7 @@ class TestInjectJob:
         assert job1 == "test-run-job-001"
         assert job2 == "test-run-job-002"
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_headless_uses_add_dir_flags(self, mock_docker, tmp_path):
         """Headless inject includes --add-dir for repos with add_dir=True."""
         mock_container = MagicMock()
@@ -156,7 +156,7 @@ class TestInjectJob:
         exec_cmd = mock_container.exec_run.call_args[0][0]
         assert "--add-dir /workspace/docs" in str(exec_cmd)
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_interactive_uses_add_dir_flags(self, mock_docker, tmp_path):
         """Interactive inject includes --add-dir for repos with add_dir=True."""
         mock_container = MagicMock()
@@ -178,7 +178,7 @@ class TestInjectJob:
         all_calls = [str(c) for c in mock_container.exec_run.call_args_list]
         assert any("--add-dir /workspace/docs" in c for c in all_calls)
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_interactive_inject_checks_tmux_exit_code(self, mock_docker, tmp_path):
         """Interactive inject runs tmux new-window synchronously and checks exit code."""
         mock_container = MagicMock()
@@ -205,7 +205,7 @@ class TestInjectJob:
         _, kwargs = tmux_calls[0]
         assert kwargs.get("detach") is not True
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_interactive_inject_raises_on_tmux_failure(self, mock_docker, tmp_path):
         """Interactive inject raises if tmux new-window fails."""
         mock_container = MagicMock()
@@ -228,7 +228,7 @@ class TestInjectJob:
                     workdir_key="code",
                 )
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_headless_uses_skip_permissions(self, mock_docker, tmp_path):
         """Headless inject includes --dangerously-skip-permissions if configured."""
         mock_container = MagicMock()
@@ -250,7 +250,6 @@ class TestInjectJob:
         assert "--dangerously-skip-permissions" in str(exec_cmd)
 
 
-from click.testing import CliRunner
 from scad.cli import main
 
 
@@ -261,7 +260,7 @@ class TestSessionInjectCLI:
     @patch("scad.cli.inject_job")
     @patch("scad.cli.load_config")
     @patch("scad.cli._config_for_run")
-    def test_inject_headless(self, mock_config_for_run, mock_load, mock_inject, mock_validate):
+    def test_inject_headless(self, mock_config_for_run, mock_load, mock_inject, mock_validate, runner):
         """session inject --headless runs headless injection."""
         from scad.config import ScadConfig, RepoConfig
         config = ScadConfig(
@@ -272,7 +271,6 @@ class TestSessionInjectCLI:
         mock_load.return_value = config
         mock_inject.return_value = "test-run-job-001"
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "session", "inject", "test-run",
             "--prompt", "Do the thing",
@@ -285,16 +283,15 @@ class TestSessionInjectCLI:
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.inject_job")
     @patch("scad.cli._config_for_run")
-    def test_inject_requires_prompt(self, mock_config_for_run, mock_inject, mock_validate):
+    def test_inject_requires_prompt(self, mock_config_for_run, mock_inject, mock_validate, runner):
         """session inject without --prompt should fail."""
-        runner = CliRunner()
         result = runner.invoke(main, ["session", "inject", "test-run"])
         assert result.exit_code != 0
 
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.inject_job")
     @patch("scad.cli._config_for_run")
-    def test_inject_interactive_default(self, mock_config_for_run, mock_inject, mock_validate):
+    def test_inject_interactive_default(self, mock_config_for_run, mock_inject, mock_validate, runner):
         """session inject without --headless defaults to interactive."""
         from scad.config import ScadConfig, RepoConfig
         config = ScadConfig(
@@ -304,7 +301,6 @@ class TestSessionInjectCLI:
         mock_config_for_run.return_value = config
         mock_inject.return_value = "test-run-job-001"
 
-        runner = CliRunner()
         result = runner.invoke(main, [
             "session", "inject", "test-run",
             "--prompt", "Fix bug",
@@ -347,12 +343,11 @@ class TestSessionJobsCLI:
 
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.list_jobs")
-    def test_jobs_shows_table(self, mock_list, mock_validate):
+    def test_jobs_shows_table(self, mock_list, mock_validate, runner):
         mock_list.return_value = [
             {"job_id": "run-job-001", "mode": "headless", "branch": None, "started": "2026-03-02T15:00:00+00:00"},
             {"job_id": "run-job-002", "mode": "interactive", "branch": "feat-x", "started": "2026-03-02T15:01:00+00:00"},
         ]
-        runner = CliRunner()
         result = runner.invoke(main, ["session", "jobs", "test-run"])
         assert result.exit_code == 0
         assert "job-001" in result.output
@@ -362,9 +357,8 @@ class TestSessionJobsCLI:
 
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.list_jobs")
-    def test_jobs_empty(self, mock_list, mock_validate):
+    def test_jobs_empty(self, mock_list, mock_validate, runner):
         mock_list.return_value = []
-        runner = CliRunner()
         result = runner.invoke(main, ["session", "jobs", "test-run"])
         assert result.exit_code == 0
         assert "No jobs" in result.output
@@ -372,7 +366,7 @@ class TestSessionJobsCLI:
 
 class TestBranchPerJob:
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_inject_with_branch_includes_checkout(self, mock_docker, tmp_path):
         """Inject with --branch includes git checkout in exec command."""
         mock_container = MagicMock()
@@ -396,7 +390,7 @@ class TestBranchPerJob:
         assert "git checkout" in bash_cmd
         assert "feature-x" in bash_cmd
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_inject_branch_stored_in_metadata(self, mock_docker, tmp_path):
         """Branch is recorded in job metadata."""
         mock_container = MagicMock()
@@ -525,7 +519,7 @@ class TestCodeDiff:
 class TestInjectWait:
     """Tests for --wait blocking behavior."""
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_wait_does_not_detach(self, mock_docker, tmp_path):
         """When wait=True, docker exec is NOT detached."""
         mock_container = MagicMock()
@@ -548,7 +542,7 @@ class TestInjectWait:
         claude_call = mock_container.exec_run.call_args_list[1]
         assert claude_call[1].get("detach") is not True
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_wait_returns_exit_code(self, mock_docker, tmp_path):
         """Wait mode returns the exit code from docker exec."""
         mock_container = MagicMock()
@@ -570,7 +564,7 @@ class TestInjectWait:
         assert isinstance(result, tuple)
         assert result[1] == 0
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_no_wait_still_detaches(self, mock_docker, tmp_path):
         """Without wait, inject still detaches (existing behavior)."""
         mock_container = MagicMock()
@@ -593,7 +587,7 @@ class TestInjectWait:
         claude_call = mock_container.exec_run.call_args_list[1]
         assert claude_call[1].get("detach") is True
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_wait_with_interactive_raises(self, mock_docker, tmp_path):
         """wait=True with headless=False raises ValueError."""
         mock_container = MagicMock()
@@ -619,13 +613,12 @@ class TestInjectTail:
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.inject_job")
     @patch("scad.cli._config_for_run")
-    def test_tail_requires_wait(self, mock_config, mock_inject, mock_validate):
+    def test_tail_requires_wait(self, mock_config, mock_inject, mock_validate, runner):
         """--tail without --wait should error."""
         from scad.config import ScadConfig, RepoConfig
         mock_config.return_value = ScadConfig(
             name="test", repos={"code": RepoConfig(path="/tmp/code", workdir=True)}
         )
-        runner = CliRunner()
         result = runner.invoke(main, [
             "session", "inject", "test-run",
             "--prompt", "Task",
@@ -637,14 +630,13 @@ class TestInjectTail:
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.inject_job")
     @patch("scad.cli._config_for_run")
-    def test_wait_tail_accepted(self, mock_config, mock_inject, mock_validate):
+    def test_wait_tail_accepted(self, mock_config, mock_inject, mock_validate, runner):
         """--wait --tail is a valid combination."""
         from scad.config import ScadConfig, RepoConfig
         mock_config.return_value = ScadConfig(
             name="test", repos={"code": RepoConfig(path="/tmp/code", workdir=True)}
         )
         mock_inject.return_value = ("test-job-001", 0)
-        runner = CliRunner()
         result = runner.invoke(main, [
             "session", "inject", "test-run",
             "--prompt", "Task",
@@ -656,7 +648,7 @@ class TestInjectTail:
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.inject_job")
     @patch("scad.cli._config_for_run")
-    def test_tail_thread_starts_and_stops(self, mock_config, mock_inject, mock_validate, tmp_path):
+    def test_tail_thread_starts_and_stops(self, mock_config, mock_inject, mock_validate, tmp_path, runner):
         """--wait --tail starts a tailing thread that stops after inject_job returns."""
         from scad.config import ScadConfig, RepoConfig
         mock_config.return_value = ScadConfig(
@@ -673,7 +665,6 @@ class TestInjectTail:
             '{"type":"assistant","message":{"content":[{"type":"tool_use","name":"Read","input":{"file_path":"/tmp/x"}}]}}\n'
         )
 
-        runner = CliRunner()
         with patch("scad.cli.SCAD_DIR", scad_dir):
             result = runner.invoke(main, [
                 "session", "inject", "test-run",
@@ -686,7 +677,7 @@ class TestInjectTail:
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.inject_job")
     @patch("scad.cli._config_for_run")
-    def test_tail_displays_tool_activity(self, mock_config, mock_inject, mock_validate, tmp_path):
+    def test_tail_displays_tool_activity(self, mock_config, mock_inject, mock_validate, tmp_path, runner):
         """--tail should display condensed tool activity from stream.jsonl."""
         import json as _json
         from scad.config import ScadConfig, RepoConfig
@@ -714,7 +705,6 @@ class TestInjectTail:
         ]
         stream_file.write_text("\n".join(lines) + "\n")
 
-        runner = CliRunner()
         with patch("scad.cli.SCAD_DIR", scad_dir):
             result = runner.invoke(main, [
                 "session", "inject", "test-run",
@@ -733,7 +723,7 @@ class TestInjectTail:
 class TestSendToJob:
     """Tests for send_to_job() — send input to running interactive Claude."""
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_send_keys_to_tmux(self, mock_docker, tmp_path):
         """send_to_job sends text via tmux send-keys."""
         mock_container = MagicMock()
@@ -755,7 +745,7 @@ class TestSendToJob:
         calls = [str(c) for c in mock_container.exec_run.call_args_list]
         assert any("send-keys" in c for c in calls)
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_send_errors_if_no_interactive_jobs(self, mock_docker, tmp_path):
         """send_to_job raises if no interactive jobs exist."""
         mock_container = MagicMock()
@@ -773,7 +763,7 @@ class TestSendToJob:
             with pytest.raises(RuntimeError, match="No interactive"):
                 send_to_job("test-run", "hello")
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_send_errors_if_multiple_interactive_no_job_id(self, mock_docker, tmp_path):
         """send_to_job raises if multiple interactive jobs and no job_id specified."""
         mock_container = MagicMock()
@@ -792,7 +782,7 @@ class TestSendToJob:
             with pytest.raises(RuntimeError, match="Multiple interactive"):
                 send_to_job("test-run", "hello")
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_send_with_explicit_job_id(self, mock_docker, tmp_path):
         """send_to_job with explicit job_id targets that job."""
         mock_container = MagicMock()
@@ -814,7 +804,7 @@ class TestSendToJob:
         calls = [str(c) for c in mock_container.exec_run.call_args_list]
         assert any("send-keys" in c and "job-002" in c for c in calls)
 
-    @patch("scad.container.docker.from_env")
+    @patch("docker.from_env")
     def test_send_container_not_running_raises(self, mock_docker, tmp_path):
         """send_to_job raises if container is not running."""
         mock_container = MagicMock()
@@ -832,9 +822,8 @@ class TestSessionSendCLI:
 
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.send_to_job")
-    def test_send_basic(self, mock_send, mock_validate):
+    def test_send_basic(self, mock_send, mock_validate, runner):
         """session send passes text to send_to_job."""
-        runner = CliRunner()
         result = runner.invoke(main, [
             "session", "send", "test-run", "summarize what you did",
         ])
@@ -843,9 +832,8 @@ class TestSessionSendCLI:
 
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.send_to_job")
-    def test_send_with_job_flag(self, mock_send, mock_validate):
+    def test_send_with_job_flag(self, mock_send, mock_validate, runner):
         """session send --job targets specific job."""
-        runner = CliRunner()
         result = runner.invoke(main, [
             "session", "send", "test-run",
             "--job", "test-run-job-002",
@@ -856,10 +844,9 @@ class TestSessionSendCLI:
 
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.send_to_job")
-    def test_send_error_displayed(self, mock_send, mock_validate):
+    def test_send_error_displayed(self, mock_send, mock_validate, runner):
         """session send shows error if send_to_job fails."""
         mock_send.side_effect = RuntimeError("No interactive jobs")
-        runner = CliRunner()
         result = runner.invoke(main, [
             "session", "send", "test-run", "hello",
         ])
@@ -927,10 +914,9 @@ class TestCodeBranchCLI:
 
     @patch("scad.cli.validate_run_id")
     @patch("scad.cli.create_branch")
-    def test_branch_command(self, mock_branch, mock_validate):
+    def test_branch_command(self, mock_branch, mock_validate, runner):
         """code branch creates branch in clones."""
         mock_branch.return_value = ["code"]
-        runner = CliRunner()
         result = runner.invoke(main, ["code", "branch", "test-run", "feature-x"])
         assert result.exit_code == 0
         mock_branch.assert_called_once_with("test-run", "feature-x")
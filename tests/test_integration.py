@@ -6,7 +6,7 @@ import pytest
 from pathlib import Path
 
 from scad.config import ScadConfig
-from scad.container import render_build_context, generate_run_id
+from scad.container import _build_context_files, generate_run_id
 
 
 @pytest.fixture
@@ -41,21 +41,19 @@ def integration_config(integration_repo):
 
 
 class TestBuildContext:
-    def test_full_render(self, integration_config, tmp_path):
-        build_dir = tmp_path / "build"
-        build_dir.mkdir()
-        render_build_context(integration_config, build_dir)
+    def test_full_render(self, integration_config):
+        files = _build_context_files(integration_config)
 
-        assert (build_dir / "Dockerfile").exists()
-        assert (build_dir / "entrypoint.sh").exists()
-        assert (build_dir / "bootstrap-claude.sh").exists()
-        assert (build_dir / "bootstrap-claude.conf").exists()
+        assert "Dockerfile" in files
+        assert "entrypoint.sh" in files
+        assert "bootstrap-claude.sh" in files
+        assert "bootstrap-claude.conf" in files
 
-        dockerfile = (build_dir / "Dockerfile").read_text()
+        dockerfile = files["Dockerfile"].decode()
         assert "FROM python:3.11-slim" in dockerfile
         assert "ENTRYPOINT" in dockerfile
 
-        entrypoint = (build_dir / "entrypoint.sh").read_text()
+        entrypoint = files["entrypoint.sh"].decode()
         assert "cd /workspace/code" in entrypoint
         assert "git clone" not in entrypoint
         assert "git bundle" not in entrypoint